@@ -6,7 +6,7 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from xbot.execution.risk_service import RiskLimits
+from xbot.execution.risk_service import DEFAULT_RISK_LIMITS, RiskLimits
 from xbot.core.heartbeat import HeartbeatConfig
 
 try:
@@ -27,7 +27,7 @@ class AppConfig:
     timeout_secs: float = 120.0
     reduce_only: int = 0
     symbol_map: Dict[str, str] = field(default_factory=dict)
-    risk_limits: RiskLimits = field(default_factory=RiskLimits)
+    risk_limits: RiskLimits = DEFAULT_RISK_LIMITS
     heartbeat_config: Optional[HeartbeatConfig] = None
 
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from typing import Dict
+from typing import Dict, Type
 import os
 from pathlib import Path
 
@@ -11,12 +11,13 @@ from xbot.core.clock import WallClock
 from xbot.core.lifecycle import LifecycleController
 from xbot.core.heartbeat import HeartbeatService
 from xbot.execution.market_data_service import MarketDataService
+from xbot.execution.models import OrderState
 from xbot.execution.order_service import OrderService
 from xbot.execution.position_service import PositionService
 from xbot.execution.risk_service import RiskService
 from xbot.execution.tracking_limit import TrackingLimitEngine
 from xbot.execution.router import ExecutionRouter
-from xbot.strategy.base import StrategyConfig
+from xbot.strategy.base import Strategy, StrategyConfig
 from xbot.strategy.market import MarketOrderStrategy
 from xbot.strategy.tracking_limit import TrackingLimitStrategy
 from xbot.strategy.diagnostic import DiagnosticStrategy
@@ -25,17 +26,34 @@ from .config import AppConfig, load_config
 from xbot.core.cache import MarketCache
 from xbot.connector.backpack_ws import BackpackWsClient
 
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional, and unavailable on Windows
+    uvloop = None
 
-STRATEGY_REGISTRY: Dict[str, str] = {
-    "market": "market",
-    "tracking_limit": "tracking_limit",
-    "diagnostic": "diagnostic",
+
+STRATEGY_REGISTRY: Dict[str, Type[Strategy]] = {
+    "market": MarketOrderStrategy,
+    "tracking_limit": TrackingLimitStrategy,
+    "diagnostic": DiagnosticStrategy,
 }
 
+# Order states that change balances/positions and so invalidate the account snapshot.
+_FILL_STATES = frozenset({OrderState.FILLED, OrderState.PARTIALLY_FILLED})
+
 
 async def run(cfg: AppConfig, log_level: str) -> None:
+    # Python 3.12+: tasks that finish without suspending (memoized metadata, cached
+    # books) complete inline instead of taking a trip through the scheduler.
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_factory)
     setup_logging(log_level)
     logger = get_logger(__name__)
+    # Resolve the mode before any connector or service is built.
+    strategy_cls = STRATEGY_REGISTRY.get(cfg.mode)
+    if strategy_cls is None:
+        raise ValueError(f"unsupported mode: {cfg.mode}")
     connector = build_connector(cfg.venue)
     market_data = MarketDataService(connector=connector, symbol_map=cfg.symbol_map)
     position_service = PositionService()
@@ -76,6 +94,8 @@ async def run(cfg: AppConfig, log_level: str) -> None:
         async def on_order_update(payload: OrderUpdatePayload) -> None:
             try:
                 await order_service.ingest_update(payload)
+                if payload.state in _FILL_STATES:
+                    router.invalidate_account()
             except Exception:
                 # Ingest failures should not crash WS task
                 pass
@@ -97,12 +117,18 @@ async def run(cfg: AppConfig, log_level: str) -> None:
             venue_symbol = market_data.resolve_symbol(cfg.symbol)
         except Exception:
             venue_symbol = cfg.symbol
+        # LighterWsClient keeps the full book (snapshot plus deltas), so tracking-limit
+        # re-quotes can read its top instead of a REST round-trip. The Backpack client
+        # only sees depth deltas, whose first level is not the best bid/ask.
+        market_data.use_book_cache(cache)
         from xbot.execution.order_service import OrderUpdatePayload
         from xbot.connector.lighter_ws import LighterWsClient
 
         async def on_order_update(payload: OrderUpdatePayload) -> None:
             try:
                 await order_service.ingest_update(payload)
+                if payload.state in _FILL_STATES:
+                    router.invalidate_account()
             except Exception:
                 pass
 
@@ -159,17 +185,11 @@ async def run(cfg: AppConfig, log_level: str) -> None:
         interval_secs=cfg.interval_secs,
         timeout_secs=cfg.timeout_secs,
     )
-    if cfg.mode == "tracking_limit":
-        strategy = TrackingLimitStrategy(router=router, clock=clock, config=strategy_cfg)
-    elif cfg.mode == "market":
-        strategy = MarketOrderStrategy(router=router, clock=clock, config=strategy_cfg)
-    elif cfg.mode == "diagnostic":
-        strategy = DiagnosticStrategy(router=router, clock=clock, config=strategy_cfg)
-    else:
-        raise ValueError(f"unsupported mode: {cfg.mode}")
+    strategy = strategy_cls(router=router, clock=clock, config=strategy_cfg)
 
     await lifecycle.start()
     try:
+        await market_data.prefetch()
         if cfg.heartbeat_config:
             heartbeat = HeartbeatService(
                 connector=connector,
@@ -186,6 +206,7 @@ async def run(cfg: AppConfig, log_level: str) -> None:
         logger.info("strategy_stop", extra={"venue": cfg.venue})
         if heartbeat:
             await heartbeat.stop()
+        await router.stop()
         await lifecycle.stop()
 
 
@@ -219,7 +240,10 @@ def main() -> None:
         reduce_only=args.reduce_only,
         config_path=args.config_path,
     )
-    asyncio.run(run(cfg, args.log_level))
+    # uvloop cuts per-await and timer overhead. uvloop.run only exists from 0.18 on;
+    # without it (or without uvloop at all) fall back to the stdlib loop.
+    runner = getattr(uvloop, "run", None) or asyncio.run
+    runner(run(cfg, args.log_level))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import ssl
 import sys
 from decimal import Decimal
 from pathlib import Path
@@ -14,15 +17,72 @@ if str(_sdk_path) not in sys.path:
     sys.path.insert(0, str(_sdk_path))
 
 try:
+    import aiohttp
+    import certifi
     from bpx.async_.public import Public  # type: ignore
     from bpx.async_.account import Account  # type: ignore
     from bpx.constants.enums import OrderTypeEnum, TimeInForceEnum
+    from bpx.http_client.async_http_client import AsyncHttpClient  # type: ignore
 except Exception as exc:  # pragma: no cover
     raise ImportError(
         "Backpack SDK not found. Ensure sdk/bpx-py is present."
     ) from exc
 
 
+# Order side by ``is_ask`` (False -> "Bid", True -> "Ask").
+_SIDES = ("Bid", "Ask")
+
+# Seconds an idle REST connection is kept open for reuse.
+_KEEPALIVE_SECS = 75.0
+
+
+class _SessionHttpClient(AsyncHttpClient):
+    """SDK HTTP client backed by one persistent aiohttp session.
+
+    The stock client opens a new session, and so a new TCP/TLS connection, for
+    every request. This one keeps connections alive between orders and builds
+    the SSL context once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        session = self._session
+        if session is None or session.closed:
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            session = self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=ssl_context, keepalive_timeout=_KEEPALIVE_SECS),
+            )
+        return session
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        async with self._get_session().request(method, url, proxy=self.proxy or None, **kwargs) as response:
+            try:
+                return await response.json()
+            except (json.JSONDecodeError, aiohttp.ContentTypeError):
+                return await response.text()
+
+    # Same request shapes as the SDK client: query params on GET, JSON bodies otherwise.
+    async def get(self, url, headers=None, params=None) -> Any:
+        return await self._request("GET", url, headers=headers, params=params)
+
+    async def post(self, url, headers=None, data=None) -> Any:
+        return await self._request("POST", url, headers=headers, data=json.dumps(data))
+
+    async def delete(self, url, headers=None, data=None) -> Any:
+        return await self._request("DELETE", url, headers=headers, data=json.dumps(data))
+
+    async def patch(self, url, headers=None, data=None) -> Any:
+        return await self._request("PATCH", url, headers=headers, data=json.dumps(data))
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
 def _decimal_places(value: str) -> int:
     if "." not in value:
         return 0
@@ -34,13 +94,34 @@ def _format_int(value: int, decimals: int) -> str:
     return str(Decimal(value) / scale)
 
 
+def _level_price(level: Any) -> Decimal:
+    return Decimal(str(level[0]))
+
+
+def _scale_decimal_str(value: object, decimals: int) -> int:
+    """Return ``value * 10**decimals`` truncated to an int, exactly.
+
+    Works on the decimal text directly, so venue prices carry no float rounding
+    and skip the Decimal multiply on the quote path.
+    """
+    text = str(value)
+    whole, _, frac = text.partition(".")
+    try:
+        return int(whole + (frac + "0" * decimals)[:decimals])
+    except ValueError:
+        # Exponent notation or other unusual forms.
+        return int(Decimal(text).scaleb(decimals))
+
+
 class BackpackConnector(BaseConnector):
     base_url = "https://api.backpack.exchange"
 
     def __init__(self, *, key_path: Path) -> None:
         super().__init__("backpack")
         self._key_path = key_path
-        self._public = Public()
+        # Shared by the public and account SDK clients so both reuse connections.
+        self._http = _SessionHttpClient()
+        self._public = Public(http_client=self._http)
         self._account: Optional[Account] = None
         self._markets: Dict[str, Dict[str, Any]] = {}
 
@@ -62,7 +143,7 @@ class BackpackConnector(BaseConnector):
         # Initialize account client if keys present
         pub, sec = self._load_keys()
         if pub and sec:
-            self._account = Account(public_key=pub, secret_key=sec)
+            self._account = Account(public_key=pub, secret_key=sec, http_client=self._http)
 
         markets = await self._public.get_markets()
         # API may return dict or list; normalize to list of dicts
@@ -72,6 +153,7 @@ class BackpackConnector(BaseConnector):
         await super().start()
 
     async def stop(self) -> None:
+        await self._http.aclose()
         await super().stop()
 
     def _get_market_info(self, symbol: str) -> Dict[str, Any]:
@@ -99,13 +181,15 @@ class BackpackConnector(BaseConnector):
         bids = book.get("bids") or []
         asks = book.get("asks") or []
         try:
-            # Ensure best prices regardless of server ordering
-            bids_sorted = sorted(bids, key=lambda x: Decimal(str(x[0])), reverse=True)
-            asks_sorted = sorted(asks, key=lambda x: Decimal(str(x[0])))
+            # Ensure best prices regardless of server ordering; only the best level
+            # is needed, so take it in one pass instead of sorting the whole side.
+            best_bid = max(bids, key=_level_price) if bids else None
+            best_ask = min(asks, key=_level_price) if asks else None
         except Exception:
-            bids_sorted, asks_sorted = bids, asks
-        bid = int(Decimal(str(bids_sorted[0][0])) * scale) if bids_sorted else None
-        ask = int(Decimal(str(asks_sorted[0][0])) * scale) if asks_sorted else None
+            best_bid = bids[0] if bids else None
+            best_ask = asks[0] if asks else None
+        bid = _scale_decimal_str(best_bid[0], price_dec) if best_bid else None
+        ask = _scale_decimal_str(best_ask[0], price_dec) if best_ask else None
         return bid, ask, scale
 
     async def submit_limit_order(
@@ -124,7 +208,7 @@ class BackpackConnector(BaseConnector):
         price_dec, size_dec = await self.get_price_size_decimals(symbol)
         qty = _format_int(base_amount, size_dec)
         px = _format_int(price, price_dec)
-        side = "Ask" if is_ask else "Bid"
+        side = _SIDES[is_ask]
         resp = await self._account.execute_order(
             symbol=symbol,
             side=side,
@@ -153,7 +237,7 @@ class BackpackConnector(BaseConnector):
             raise RuntimeError("account keys not configured for order submission")
         _, size_dec = await self.get_price_size_decimals(symbol)
         qty = _format_int(size_i, size_dec)
-        side = "Ask" if is_ask else "Bid"
+        side = _SIDES[is_ask]
         resp = await self._account.execute_order(
             symbol=symbol,
             side=side,
@@ -198,8 +282,10 @@ class BackpackConnector(BaseConnector):
     async def get_margin(self) -> Dict[str, Any]:
         if not self._account:
             return {}
-        balances = await self._account.get_balances()
-        collateral = await self._account.get_collateral()
+        balances, collateral = await asyncio.gather(
+            self._account.get_balances(),
+            self._account.get_collateral(),
+        )
         return {
             "balances": balances,
             "collateral": collateral,
@@ -4,6 +4,7 @@ import asyncio
 import base64
 import contextlib
 import json
+import logging
 import time
 from pathlib import Path
 from typing import Iterable, List, Optional, Callable, Awaitable, Dict, Any
@@ -16,6 +17,37 @@ from xbot.execution.order_service import OrderUpdatePayload
 from xbot.execution.models import OrderState
 from xbot.utils.logging import get_logger
 
+_LOG = get_logger(__name__)
+
+# Order status -> OrderState, keyed by lower-cased status.
+_ORDER_STATES: Dict[str, OrderState] = {
+    "new": OrderState.OPEN,
+    "accepted": OrderState.OPEN,
+    "open": OrderState.OPEN,
+    "partially_filled": OrderState.PARTIALLY_FILLED,
+    "partiallyfilled": OrderState.PARTIALLY_FILLED,
+    "filled": OrderState.FILLED,
+    "cancelled": OrderState.CANCELLED,
+    "canceled": OrderState.CANCELLED,
+    "failed": OrderState.FAILED,
+    "rejected": OrderState.FAILED,
+}
+# Raw status spellings seen so far -> resolved state (None when unmapped), so the
+# per-message path is a single dict probe instead of lower() plus a lookup.
+_STATE_MEMO: Dict[str, Optional[OrderState]] = {}
+_STATE_MEMO_SIZE = 256
+
+
+def _order_state(raw: str) -> Optional[OrderState]:
+    try:
+        return _STATE_MEMO[raw]
+    except KeyError:
+        pass
+    state = _ORDER_STATES.get(raw.lower())
+    if len(_STATE_MEMO) < _STATE_MEMO_SIZE:
+        _STATE_MEMO[raw] = state
+    return state
+
 
 class BackpackWsClient:
     """Backpack WebSocket client implemented using websockets and ED25519 auth.
@@ -44,7 +76,7 @@ class BackpackWsClient:
         self._reconnect_delay = reconnect_delay
         self._ping_interval = ping_interval
         self._ping_timeout = ping_timeout
-        self._logger = get_logger(__name__)
+        self._logger = _LOG
         self._running = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
         self._on_order_update = on_order_update
@@ -170,7 +202,8 @@ class BackpackWsClient:
                 if symbol:
                     await self._cache.set_position(symbol, q)
             elif stream.startswith("account.orderUpdate"):
-                self._logger.info("order_update", extra={"venue": "backpack", "data": data})
+                if self._logger.isEnabledFor(logging.INFO):
+                    self._logger.info("order_update", extra={"venue": "backpack", "data": data})
                 # Ingest into order service when client order id is present
                 await self._ingest_order_update(data)
         except Exception as exc:
@@ -188,20 +221,7 @@ class BackpackWsClient:
             except Exception:
                 return
             # Map order state
-            state_raw = (data.get("X") or data.get("status") or "").lower()
-            mapping = {
-                "new": OrderState.OPEN,
-                "accepted": OrderState.OPEN,
-                "open": OrderState.OPEN,
-                "partially_filled": OrderState.PARTIALLY_FILLED,
-                "partiallyfilled": OrderState.PARTIALLY_FILLED,
-                "filled": OrderState.FILLED,
-                "cancelled": OrderState.CANCELLED,
-                "canceled": OrderState.CANCELLED,
-                "failed": OrderState.FAILED,
-                "rejected": OrderState.FAILED,
-            }
-            state = mapping.get(state_raw)
+            state = _order_state(data.get("X") or data.get("status") or "")
             if state is None:
                 # Derive from event type when needed
                 et = (data.get("e") or "").lower()
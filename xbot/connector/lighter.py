@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import sys
 import asyncio
+import logging
+import time
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -10,6 +12,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from .base import BaseConnector
 from xbot.utils.logging import get_logger
 
+_LOG = get_logger(__name__)
+
 
 # Prefer vendored SDK: sdk/lighter-python (fallback to sdk/lighter)
 _repo_root = Path(__file__).resolve().parents[2]
@@ -24,7 +28,7 @@ for _p in _sdk_paths:
             sys.path.insert(0, sp)
 
 
-@dataclass
+@dataclass(slots=True)
 class _MarketInfo:
     symbol: str
     market_id: int
@@ -42,8 +46,11 @@ class LighterConnector(BaseConnector):
         self._markets: Dict[str, _MarketInfo] = {}
         self._sdk_available = False
         self._api_client = None  # set when SDK available
+        # OrderApi bound to _api_client, built once in start() and reused by every
+        # order-book and order lookup instead of re-importing the SDK per call.
+        self._order_api = None
         self._signer = None
-        self._logger = get_logger(__name__)
+        self._logger = _LOG
 
     def _load_keys(self) -> Dict[str, str]:
         if not self._key_path.exists():
@@ -70,7 +77,7 @@ class LighterConnector(BaseConnector):
             from lighter import ApiClient, Configuration  # type: ignore
 
             self._api_client = ApiClient(configuration=Configuration(host=self.base_url))
-            order_api = lighter.OrderApi(self._api_client)  # type: ignore[attr-defined]
+            order_api = self._order_api = lighter.OrderApi(self._api_client)  # type: ignore[attr-defined]
             ob = await order_api.order_books()
             for m in getattr(ob, "order_books", []):
                 symbol = getattr(m, "symbol", None)
@@ -149,12 +156,10 @@ class LighterConnector(BaseConnector):
     async def get_top_of_book(self, symbol: str) -> Tuple[Optional[int], Optional[int], int]:
         if not self._sdk_available:
             raise RuntimeError("Lighter SDK not available; cannot query order book")
-        import lighter  # type: ignore
         info = self._get_market_info(symbol)
         price_scale = 10 ** info.price_decimals
-        order_api = lighter.OrderApi(self._api_client)  # type: ignore[attr-defined]
         try:
-            obo = await order_api.order_book_orders(info.market_id, 1)
+            obo = await self._order_api.order_book_orders(info.market_id, 1)
         except Exception:
             return None, None, price_scale
         best_bid = None
@@ -185,33 +190,38 @@ class LighterConnector(BaseConnector):
         info = self._get_market_info(symbol)
         base_amount_i = int(base_amount)
         price_i = int(price)
-        try:
+        # One level check per order; the INFO payloads below are only built when
+        # they will be emitted (unit-check fields also need Decimal math).
+        log_info = self._logger.isEnabledFor(logging.INFO)
+        if log_info:
+            try:
+                self._logger.info(
+                    "unit_check_limit",
+                    extra={
+                        "market_id": info.market_id,
+                        "price_decimals": info.price_decimals,
+                        "size_decimals": info.size_decimals,
+                        "base_amount_i": base_amount_i,
+                        "price_i": price_i,
+                        "base_amount": float(Decimal(base_amount_i) / (Decimal(10) ** info.size_decimals)),
+                        "price": float(Decimal(price_i) / (Decimal(10) ** info.price_decimals)),
+                    },
+                )
+            except Exception:
+                pass
+        if log_info:
             self._logger.info(
-                "unit_check_limit",
+                "lighter_submit_limit",
                 extra={
                     "market_id": info.market_id,
-                    "price_decimals": info.price_decimals,
-                    "size_decimals": info.size_decimals,
-                    "base_amount_i": base_amount_i,
-                    "price_i": price_i,
-                    "base_amount": float(Decimal(base_amount_i) / (Decimal(10) ** info.size_decimals)),
-                    "price": float(Decimal(price_i) / (Decimal(10) ** info.price_decimals)),
+                    "coi": client_order_index,
+                    "base_amount": base_amount_i,
+                    "price": price_i,
+                    "is_ask": is_ask,
+                    "post_only": post_only,
+                    "reduce_only": reduce_only,
                 },
             )
-        except Exception:
-            pass
-        self._logger.info(
-            "lighter_submit_limit",
-            extra={
-                "market_id": info.market_id,
-                "coi": client_order_index,
-                "base_amount": base_amount_i,
-                "price": price_i,
-                "is_ask": is_ask,
-                "post_only": post_only,
-                "reduce_only": reduce_only,
-            },
-        )
         if base_amount_i < 10:
             self._logger.info(
                 "lighter_size_warn",
@@ -238,24 +248,27 @@ class LighterConnector(BaseConnector):
             self._logger.info("lighter_submit_limit_failed", extra={"error": str(error)})
             raise RuntimeError(f"limit order failed: {error}")
         resp = await self._signer.send_tx(self._signer.TX_TYPE_CREATE_ORDER, tx_info)
-        self._logger.info(
-            "lighter_submit_limit_ack",
-            extra={
-                "coi": client_order_index,
-                "code": getattr(resp, "code", None),
-                "tx_hash": getattr(resp, "tx_hash", None),
-            },
-        )
-        if getattr(resp, "code", None) != 200:
+        code = getattr(resp, "code", None)
+        if log_info:
+            self._logger.info(
+                "lighter_submit_limit_ack",
+                extra={
+                    "coi": client_order_index,
+                    "code": code,
+                    "tx_hash": getattr(resp, "tx_hash", None),
+                },
+            )
+        if code != 200:
             raise RuntimeError(
-                f"limit order rejected: code={getattr(resp, 'code', None)} msg={getattr(resp, 'message', None)}"
+                f"limit order rejected: code={code} msg={getattr(resp, 'message', None)}"
             )
         try:
             order_id = await self._resolve_order_id(info.market_id, client_order_index)
             if order_id:
-                self._logger.info(
-                    "lighter_submit_limit_resolved", extra={"coi": client_order_index, "order_id": order_id}
-                )
+                if log_info:
+                    self._logger.info(
+                        "lighter_submit_limit_resolved", extra={"coi": client_order_index, "order_id": order_id}
+                    )
                 return str(order_id)
         except Exception as exc:
             self._logger.info("lighter_submit_limit_lookup_error", extra={"error": str(exc)})
@@ -278,6 +291,7 @@ class LighterConnector(BaseConnector):
         """
         await self._ensure_signer()
         info = self._get_market_info(symbol)
+        log_info = self._logger.isEnabledFor(logging.INFO)
         # Fetch best prices; ensure a valid integer price >= 1
         bid, ask, scale = await self.get_top_of_book(symbol)
         price_i: int
@@ -296,18 +310,19 @@ class LighterConnector(BaseConnector):
             else:
                 price_i = int(ask)
 
-        self._logger.info(
-            "lighter_submit_market",
-            extra={
-                "market_id": info.market_id,
-                "coi": client_order_index,
-                "size_i": int(size_i),
-                "is_ask": is_ask,
-                "reduce_only": reduce_only,
-                "price_i": price_i,
-                "mode": "limit+ioc",
-            },
-        )
+        if log_info:
+            self._logger.info(
+                "lighter_submit_market",
+                extra={
+                    "market_id": info.market_id,
+                    "coi": client_order_index,
+                    "size_i": int(size_i),
+                    "is_ask": is_ask,
+                    "reduce_only": reduce_only,
+                    "price_i": price_i,
+                    "mode": "limit+ioc",
+                },
+            )
         # Prefer MARKET type with IOC and non-zero avg price to satisfy signer validation
         tx_info, error = self._signer.sign_create_order(  # type: ignore[attr-defined]
             info.market_id,
@@ -325,24 +340,27 @@ class LighterConnector(BaseConnector):
             self._logger.info("lighter_submit_market_failed", extra={"error": str(error)})
             raise RuntimeError(f"market order failed: {error}")
         resp = await self._signer.send_tx(self._signer.TX_TYPE_CREATE_ORDER, tx_info)
-        self._logger.info(
-            "lighter_submit_market_ack",
-            extra={
-                "coi": client_order_index,
-                "code": getattr(resp, "code", None),
-                "tx_hash": getattr(resp, "tx_hash", None),
-            },
-        )
-        if getattr(resp, "code", None) != 200:
+        code = getattr(resp, "code", None)
+        if log_info:
+            self._logger.info(
+                "lighter_submit_market_ack",
+                extra={
+                    "coi": client_order_index,
+                    "code": code,
+                    "tx_hash": getattr(resp, "tx_hash", None),
+                },
+            )
+        if code != 200:
             raise RuntimeError(
-                f"market order rejected: code={getattr(resp, 'code', None)} msg={getattr(resp, 'message', None)}"
+                f"market order rejected: code={code} msg={getattr(resp, 'message', None)}"
             )
         try:
             order_id = await self._resolve_order_id(info.market_id, client_order_index)
             if order_id:
-                self._logger.info(
-                    "lighter_submit_market_resolved", extra={"coi": client_order_index, "order_id": order_id}
-                )
+                if log_info:
+                    self._logger.info(
+                        "lighter_submit_market_resolved", extra={"coi": client_order_index, "order_id": order_id}
+                    )
                 return str(order_id)
         except Exception as exc:
             self._logger.info("lighter_submit_market_lookup_error", extra={"error": str(exc)})
@@ -357,19 +375,19 @@ class LighterConnector(BaseConnector):
             return {"error": "missing account_index for cancel"}
         order_index: Optional[int] = None
         try:
-            import lighter  # type: ignore
-            order_api = lighter.OrderApi(self._api_client)  # type: ignore[attr-defined]
-            deadline = int(__import__("time").time() + 600)
+            order_api = self._order_api
+            deadline = int(time.time() + 600)
             token, err = self._signer.create_auth_token_with_expiry(deadline)
             if err is not None:
                 return {"error": f"auth_token_error: {err}"}
             orders = await order_api.account_active_orders(
                 account_index=acct_idx, market_id=info.market_id, auth=token
             )
+            target = int(client_order_index)
             for o in getattr(orders, "orders", []) or []:
                 try:
                     coi_val = int(getattr(o, "client_order_index", -1))
-                    if coi_val == int(client_order_index):
+                    if coi_val == target:
                         oi = getattr(o, "order_index", None)
                         order_index = int(oi) if oi is not None else None
                         break
@@ -452,9 +470,8 @@ class LighterConnector(BaseConnector):
 
     async def _resolve_order_id(self, market_id: int, client_order_index: int) -> Optional[int]:
         try:
-            import lighter  # type: ignore
-            order_api = lighter.OrderApi(self._api_client)  # type: ignore[attr-defined]
-            deadline = int(__import__("time").time() + 600)
+            order_api = self._order_api
+            deadline = int(time.time() + 600)
             token, err = self._signer.create_auth_token_with_expiry(deadline)
             if err is not None:
                 self._logger.info("lighter_auth_token_error", extra={"error": str(err)})
@@ -462,13 +479,14 @@ class LighterConnector(BaseConnector):
             acct_idx = self.get_account_index()
             if acct_idx is None:
                 return None
+            target = int(client_order_index)
             for _ in range(10):
                 try:
                     resp = await order_api.account_active_orders(
                         account_index=acct_idx, market_id=market_id, auth=token
                     )
                     orders = getattr(resp, "orders", []) or []
-                    if orders:
+                    if orders and self._logger.isEnabledFor(logging.INFO):
                         # log minimal shape to diagnose schema
                         try:
                             first = orders[0]
@@ -480,7 +498,7 @@ class LighterConnector(BaseConnector):
                         )
                     for o in orders:
                         try:
-                            if int(getattr(o, "client_order_index", -1)) == int(client_order_index):
+                            if int(getattr(o, "client_order_index", -1)) == target:
                                 oi = getattr(o, "order_index", None)
                                 return int(oi) if oi is not None else None
                         except Exception:
@@ -494,12 +512,11 @@ class LighterConnector(BaseConnector):
 
     async def _probe_visibility(self, market_id: int, client_order_index: int) -> None:
         try:
-            import lighter  # type: ignore
             acct_idx = self.get_account_index()
             if acct_idx is None:
                 return
-            order_api = lighter.OrderApi(self._api_client)  # type: ignore[attr-defined]
-            deadline = int(__import__("time").time() + 600)
+            order_api = self._order_api
+            deadline = int(time.time() + 600)
             token, err = self._signer.create_auth_token_with_expiry(deadline)
             if err is not None:
                 return
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import logging
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable, Awaitable
@@ -14,6 +15,40 @@ from xbot.utils.logging import get_logger
 from xbot.execution.order_service import OrderUpdatePayload
 from xbot.execution.models import OrderState
 
+_LOG = get_logger(__name__)
+
+# Order status -> OrderState, keyed by lower-cased status.
+_ORDER_STATES: Dict[str, OrderState] = {
+    "open": OrderState.OPEN,
+    "accepted": OrderState.OPEN,
+    "in-progress": OrderState.OPEN,
+    "pending": OrderState.OPEN,
+    "filled": OrderState.FILLED,
+    "canceled": OrderState.CANCELLED,
+    "cancelled": OrderState.CANCELLED,
+    "rejected": OrderState.FAILED,
+    "failed": OrderState.FAILED,
+}
+# Raw status spellings seen so far -> resolved state (None when unmapped), so the
+# per-message path is a single dict probe instead of lower() plus a lookup.
+_STATE_MEMO: Dict[str, Optional[OrderState]] = {}
+_STATE_MEMO_SIZE = 256
+
+
+def _order_state(raw: str) -> Optional[OrderState]:
+    try:
+        return _STATE_MEMO[raw]
+    except KeyError:
+        pass
+    key = raw.lower()
+    state = _ORDER_STATES.get(key)
+    if state is None and key.startswith("canceled"):
+        # Cancellations may carry a reason suffix after "canceled".
+        state = OrderState.CANCELLED
+    if len(_STATE_MEMO) < _STATE_MEMO_SIZE:
+        _STATE_MEMO[raw] = state
+    return state
+
 
 class LighterWsClient:
     """Lighter WebSocket client with reconnect, trades, and account updates."""
@@ -44,7 +79,7 @@ class LighterWsClient:
         self._ping_interval = ping_interval
         self._ping_timeout = ping_timeout
         self._on_order_update = on_order_update
-        self._logger = get_logger(__name__)
+        self._logger = _LOG
         self._running = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
 
@@ -323,30 +358,31 @@ class LighterWsClient:
                 await self._ingest_order_update(item)
                 parsed_any = True
 
-        if not parsed_any:
+        if not parsed_any and self._logger.isEnabledFor(logging.INFO):
             self._logger.info(
                 "ws_account_no_orders",
                 extra={"venue": "lighter", "keys": list(msg.keys())[:10]},
             )
 
         # Positions, guarded by type checks to avoid calling .get on non-dicts
-        positions: Any = None
-        if isinstance(msg.get("positions"), list):
-            positions = msg.get("positions")
-        elif isinstance(data, dict) and isinstance(data.get("positions"), list):
-            positions = data.get("positions")
-        elif isinstance(acc, dict) and isinstance(acc.get("positions"), list):
-            positions = acc.get("positions")
+        positions: Any = msg.get("positions")
+        if not isinstance(positions, list):
+            positions = data.get("positions") if isinstance(data, dict) else None
+            if not isinstance(positions, list):
+                positions = acc.get("positions") if isinstance(acc, dict) else None
         if isinstance(positions, list):
+            default_sym = self._venue_symbol
+            set_position = self._cache.set_position
             for p in positions:
                 try:
                     if not isinstance(p, dict):
                         continue
-                    sym = p.get("symbol") or self._venue_symbol
-                    pos_str = p.get("position") or p.get("net_size") or "0"
-                    q = float(str(pos_str))
-                    if sym:
-                        await self._cache.set_position(sym, q)
+                    sym = p.get("symbol") or default_sym
+                    if not sym:
+                        continue
+                    # float() accepts the venue's str and numeric encodings alike.
+                    q = float(p.get("position") or p.get("net_size") or 0)
+                    await set_position(sym, q)
                 except Exception:
                     continue
 
@@ -362,21 +398,7 @@ class LighterWsClient:
             )
             if coi is None:
                 return
-            state_raw = (data.get("status") or data.get("state") or "").lower()
-            mapping = {
-                "open": OrderState.OPEN,
-                "accepted": OrderState.OPEN,
-                "in-progress": OrderState.OPEN,
-                "pending": OrderState.OPEN,
-                "filled": OrderState.FILLED,
-                "canceled": OrderState.CANCELLED,
-                "cancelled": OrderState.CANCELLED,
-                "rejected": OrderState.FAILED,
-                "failed": OrderState.FAILED,
-            }
-            state = mapping.get(state_raw)
-            if state is None and state_raw.startswith("canceled"):
-                state = OrderState.CANCELLED
+            state = _order_state(data.get("status") or data.get("state") or "")
             if state in (None, OrderState.OPEN):
                 try:
                     filled_s = data.get("filled_base_amount") or data.get("filled") or "0"
@@ -1,65 +1,84 @@
 from __future__ import annotations
 
-import asyncio
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Deque, Dict, Tuple, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionInfo:
     symbol: str
     position: float
     ts: float
 
 
+def _tail(trades: Deque[dict], limit: int) -> list:
+    # Walk only the newest ``limit`` entries instead of copying the whole ring buffer.
+    if 0 < limit < len(trades):
+        tail = list(islice(reversed(trades), limit))
+        tail.reverse()
+        return tail
+    return list(trades)
+
+
 class MarketCache:
+    """Latest market and account state fed by the WebSocket clients.
+
+    No method awaits internally, so each update is atomic on the event loop and
+    needs no lock.
+    """
+
     def __init__(self) -> None:
-        self._lock = asyncio.Lock()
+        # (bid, ask, time.monotonic() at update); the stamp is only used for age checks.
         self.orderbooks: Dict[str, Tuple[float | None, float | None, float]] = {}
         self.trades: Dict[str, Deque[dict]] = defaultdict(lambda: deque(maxlen=100))
         self.positions: Dict[str, PositionInfo] = {}
         self.balances: Dict[str, Tuple[float, float, float]] = {}
+        # Asset spellings seen so far mapped to their upper-cased balance key.
+        self._asset_keys: Dict[str, str] = {}
+
+    def _asset_key(self, asset: str) -> str:
+        try:
+            return self._asset_keys[asset]
+        except KeyError:
+            key = self._asset_keys[asset] = asset.upper()
+            return key
 
     async def set_top(self, symbol: str, bid: float | None, ask: float | None) -> None:
-        async with self._lock:
-            self.orderbooks[symbol] = (bid, ask, time.time())
+        self.orderbooks[symbol] = (bid, ask, time.monotonic())
 
     async def add_trade(self, symbol: str, trade: dict) -> None:
-        async with self._lock:
-            self.trades[symbol].append(trade)
+        self.trades[symbol].append(trade)
 
     async def set_position(self, symbol: str, pos: float) -> None:
-        async with self._lock:
-            self.positions[symbol] = PositionInfo(symbol=symbol, position=pos, ts=time.time())
+        self.positions[symbol] = PositionInfo(symbol=symbol, position=pos, ts=time.time())
 
     async def set_balance(self, asset: str, total: float, available: Optional[float] = None) -> None:
-        async with self._lock:
-            avail = available if available is not None else total
-            self.balances[asset.upper()] = (total, avail, time.time())
+        avail = available if available is not None else total
+        self.balances[self._asset_key(asset)] = (total, avail, time.time())
 
     async def set_balances(self, payload: Dict[str, Tuple[float, float] | float]) -> None:
         # payload: {"USDC": (total, available)} or {"USDC": total}
-        async with self._lock:
-            ts = time.time()
-            for k, v in payload.items():
-                if isinstance(v, tuple):
-                    total, available = float(v[0]), float(v[1])
-                else:
-                    total, available = float(v), float(v)
-                self.balances[k.upper()] = (total, available, ts)
+        ts = time.time()
+        asset_key = self._asset_key
+        for k, v in payload.items():
+            if isinstance(v, tuple):
+                total, available = float(v[0]), float(v[1])
+            else:
+                total, available = float(v), float(v)
+            self.balances[asset_key(k)] = (total, available, ts)
 
     async def snapshot_positions(self) -> Dict[str, dict]:
-        async with self._lock:
-            return {k: {"position": v.position, "ts": v.ts} for k, v in self.positions.items()}
+        return {k: {"position": v.position, "ts": v.ts} for k, v in self.positions.items()}
 
     async def snapshot_trades(self, symbol: Optional[str] = None, limit: int = 10) -> Dict[str, list]:
-        async with self._lock:
-            if symbol is None:
-                return {k: list(self.trades[k])[-limit:] for k in self.trades}
-            return {symbol: list(self.trades[symbol])[-limit:]}
+        if symbol is None:
+            return {k: _tail(v, limit) for k, v in self.trades.items()}
+        # .get so reading an unknown symbol does not allocate a buffer for it.
+        trades = self.trades.get(symbol)
+        return {symbol: _tail(trades, limit) if trades is not None else []}
 
     async def snapshot_balances(self) -> Dict[str, dict]:
-        async with self._lock:
-            return {k: {"total": v[0], "available": v[1], "ts": v[2]} for k, v in self.balances.items()}
+        return {k: {"total": v[0], "available": v[1], "ts": v[2]} for k, v in self.balances.items()}
@@ -63,14 +63,12 @@ class HeartbeatService:
             await asyncio.sleep(self._config.interval_secs)
 
     async def _emit_once(self) -> None:
+        # Shares the router's account snapshot with strategies polling the same venue.
         try:
-            positions = await self._connector.get_positions()
+            account = await self._router.fetch_account()
+            positions, margin = account.positions, account.margin
         except Exception:
-            positions = []
-        try:
-            margin = await self._connector.get_margin()
-        except Exception:
-            margin = {}
+            positions, margin = [], {}
         payload = {
             "ts": int(self._clock.now()),
             "strategy": self._strategy,
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN, getcontext
-from typing import Dict, Mapping, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Mapping, Optional, Tuple, TypeVar, TYPE_CHECKING
 
 from xbot.connector.interface import IConnector
 
+if TYPE_CHECKING:
+    from xbot.core.cache import MarketCache
+
 getcontext().prec = 28
 
+_T = TypeVar("_T")
+
+# Upper bound on in-flight connector calls issued by one service instance.
+DEFAULT_CONCURRENCY = 8
+
+# Oldest WS top-of-book (seconds) served from the market cache before falling
+# back to a connector round-trip.
+BOOK_CACHE_MAX_AGE = 1.0
+
 
 @dataclass(slots=True)
 class SymbolSpec:
@@ -23,56 +36,170 @@ class UnknownSymbolError(KeyError):
 class MarketDataService:
     """Resolves canonical symbols, precision and conversion helpers."""
 
+    __slots__ = (
+        "_connector",
+        "_fetch_decimals",
+        "_fetch_min_size",
+        "_fetch_top_of_book",
+        "_venue_sem",
+        "_symbol_map",
+        "_symbols",
+        "_specs",
+        "_decimal_cache",
+        "_min_size_cache",
+        "_decimals_inflight",
+        "_min_size_inflight",
+        "_book_cache",
+        "_book_max_age",
+    )
+
     def __init__(
         self,
         *,
         connector: IConnector,
         symbol_map: Mapping[str, str],
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> None:
         self._connector = connector
+        # Connector entry points bound once; the read path skips the lookups.
+        self._fetch_decimals = connector.get_price_size_decimals
+        self._fetch_min_size = connector.get_min_size_i
+        self._fetch_top_of_book = connector.get_top_of_book
+        self._venue_sem = asyncio.Semaphore(concurrency)
         self._symbol_map: Dict[str, SymbolSpec] = {
             canonical.upper(): SymbolSpec(canonical=canonical.upper(), venue_symbol=venue)
             for canonical, venue in symbol_map.items()
         }
+        self._symbols: Tuple[str, ...] = tuple(self._symbol_map)
+        # Every symbol spelling seen so far mapped straight to its spec, so both
+        # key and venue-symbol resolution are a single dict probe.
+        self._specs: Dict[str, SymbolSpec] = {
+            canonical: self._symbol_map[canonical.upper()] for canonical in symbol_map
+        }
+        self._specs.update(self._symbol_map)
         self._decimal_cache: Dict[str, Tuple[int, int]] = {}
         self._min_size_cache: Dict[str, int] = {}
-        self._locks: Dict[str, asyncio.Lock] = {}
+        # In-flight metadata loads per kind, keyed by canonical symbol; concurrent
+        # callers await the same task instead of issuing duplicate RPCs.
+        self._decimals_inflight: Dict[str, asyncio.Task] = {}
+        self._min_size_inflight: Dict[str, asyncio.Task] = {}
+        self._book_cache: Optional[MarketCache] = None
+        self._book_max_age = BOOK_CACHE_MAX_AGE
+
+    def set_concurrency(self, limit: int) -> None:
+        """Change the connector concurrency bound; calls already in flight are unaffected."""
+        if limit <= 0:
+            raise ValueError("concurrency must be positive")
+        self._venue_sem = asyncio.Semaphore(limit)
+
+    def use_book_cache(self, cache: MarketCache, *, max_age: float = BOOK_CACHE_MAX_AGE) -> None:
+        """Serve ``get_top_of_book`` from WS-fed ``cache`` while its entry is fresh.
+
+        Only attach a cache whose feed maintains the full book (snapshot plus
+        deltas) and publishes its best levels; a top taken from raw depth deltas
+        is not the touch.
+        """
+        self._book_cache = cache
+        self._book_max_age = max_age
+
+    # Hot lookups below subscript and catch KeyError: a hit is a single probe with
+    # no method call, and misses only happen once per spelling or symbol.
+    def _spec(self, symbol: str) -> SymbolSpec:
+        try:
+            return self._specs[symbol]
+        except KeyError:
+            pass
+        spec = self._symbol_map.get(symbol.upper())
+        if spec is None:
+            raise UnknownSymbolError(symbol)
+        self._specs[symbol] = spec
+        return spec
 
     def _canonical_key(self, symbol: str) -> str:
-        key = symbol.upper()
-        if key not in self._symbol_map:
-            raise UnknownSymbolError(symbol)
-        return key
+        return self._spec(symbol).canonical
 
     def resolve_symbol(self, symbol: str) -> str:
-        key = self._canonical_key(symbol)
-        return self._symbol_map[key].venue_symbol
+        return self._spec(symbol).venue_symbol
+
+    @staticmethod
+    async def _coalesce(
+        inflight: Dict[str, asyncio.Task],
+        key: str,
+        load: Callable[[str], Awaitable[_T]],
+    ) -> _T:
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load(key))
+            inflight[key] = task
+
+            def _done(t: asyncio.Task) -> None:
+                inflight.pop(key, None)
+                # If every caller was cancelled nobody awaits the task; retrieve
+                # its error so it is not logged as never retrieved.
+                if not t.cancelled():
+                    t.exception()
+
+            task.add_done_callback(_done)
+        # Shield so one cancelled caller does not abort the load for the others.
+        return await asyncio.shield(task)
 
     async def get_price_size_decimals(self, symbol: str) -> Tuple[int, int]:
         key = self._canonical_key(symbol)
-        if key in self._decimal_cache:
+        try:
             return self._decimal_cache[key]
-        lock = self._locks.setdefault(key, asyncio.Lock())
-        async with lock:
-            if key in self._decimal_cache:
-                return self._decimal_cache[key]
-            venue_symbol = self._symbol_map[key].venue_symbol
-            decimals = await self._connector.get_price_size_decimals(venue_symbol)
-            self._decimal_cache[key] = decimals
-            return decimals
+        except KeyError:
+            pass
+        return await self._coalesce(self._decimals_inflight, key, self._load_decimals)
+
+    async def _load_decimals(self, key: str) -> Tuple[int, int]:
+        venue_symbol = self._symbol_map[key].venue_symbol
+        async with self._venue_sem:
+            decimals = await self._fetch_decimals(venue_symbol)
+        self._decimal_cache[key] = decimals
+        return decimals
 
     async def get_min_size_i(self, symbol: str) -> int:
         key = self._canonical_key(symbol)
-        if key in self._min_size_cache:
+        try:
             return self._min_size_cache[key]
-        lock = self._locks.setdefault(key, asyncio.Lock())
-        async with lock:
-            if key in self._min_size_cache:
-                return self._min_size_cache[key]
-            venue_symbol = self._symbol_map[key].venue_symbol
-            minimum = await self._connector.get_min_size_i(venue_symbol)
-            self._min_size_cache[key] = minimum
-            return minimum
+        except KeyError:
+            pass
+        return await self._coalesce(self._min_size_inflight, key, self._load_min_size)
+
+    async def _load_min_size(self, key: str) -> int:
+        venue_symbol = self._symbol_map[key].venue_symbol
+        async with self._venue_sem:
+            minimum = await self._fetch_min_size(venue_symbol)
+        self._min_size_cache[key] = minimum
+        return minimum
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop cached metadata for ``symbol``, or for every symbol when omitted."""
+        if symbol is None:
+            self._decimal_cache.clear()
+            self._min_size_cache.clear()
+            return
+        key = self._canonical_key(symbol)
+        self._decimal_cache.pop(key, None)
+        self._min_size_cache.pop(key, None)
+
+    async def prefetch(self) -> None:
+        """Warm decimals and minimum size for every configured symbol concurrently.
+
+        Best effort: a symbol that fails here raises again on first use.
+        """
+        async with asyncio.TaskGroup() as tg:
+            for key in self._symbols:
+                tg.create_task(self._warm(self.get_price_size_decimals(key)))
+                tg.create_task(self._warm(self.get_min_size_i(key)))
+
+    @staticmethod
+    async def _warm(load: Awaitable[object]) -> None:
+        # Swallow per-symbol failures so one bad symbol does not cancel the group.
+        try:
+            await load
+        except Exception:
+            pass
 
     async def to_price_i(self, symbol: str, price: Decimal | float | str) -> int:
         price_decimals, _ = await self.get_price_size_decimals(symbol)
@@ -93,8 +220,30 @@ class MarketDataService:
 
     async def get_top_of_book(self, symbol: str) -> Tuple[Optional[int], Optional[int], int]:
         venue_symbol = self.resolve_symbol(symbol)
-        bid_i, ask_i, scale = await self._connector.get_top_of_book(venue_symbol)
+        cache = self._book_cache
+        if cache is not None:
+            book = self._cached_book(cache, symbol, venue_symbol)
+            if book is not None:
+                return book
+        async with self._venue_sem:
+            bid_i, ask_i, scale = await self._fetch_top_of_book(venue_symbol)
         return bid_i, ask_i, scale
 
-
-__all__ = ["MarketDataService", "SymbolSpec", "UnknownSymbolError"]
+    def _cached_book(
+        self, cache: MarketCache, symbol: str, venue_symbol: str
+    ) -> Optional[Tuple[Optional[int], Optional[int], int]]:
+        entry = cache.orderbooks.get(venue_symbol)
+        if entry is None:
+            return None
+        bid, ask, ts = entry
+        if bid is None or ask is None or time.monotonic() - ts > self._book_max_age:
+            return None
+        decimals = self._decimal_cache.get(self._canonical_key(symbol))
+        if decimals is None:
+            return None
+        scale = 10 ** decimals[0]
+        # Same truncating conversion the connectors apply to REST depth levels.
+        return int(Decimal(str(bid)) * scale), int(Decimal(str(ask)) * scale), scale
+
+
+__all__ = ["MarketDataService", "SymbolSpec", "UnknownSymbolError", "BOOK_CACHE_MAX_AGE"]
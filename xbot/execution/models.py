@@ -6,7 +6,12 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
 
 
 class OrderState(str, Enum):
@@ -21,10 +26,37 @@ class OrderState(str, Enum):
 FINAL_STATES = {OrderState.FILLED, OrderState.CANCELLED, OrderState.FAILED}
 
 
+def _encode_line(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles those
+    return (json.dumps(payload, ensure_ascii=True) + "\n").encode("ascii")
+
+
+# Log directories already created by this process; orders share a handful of
+# directories, so each is created once instead of on every persisted event.
+_READY_DIRS: Set[Path] = set()
+
+
+def _resolve(fut: asyncio.Future[OrderEvent], event: OrderEvent) -> None:
+    # Scheduled via call_soon; the waiter may have been cancelled in between.
+    if not fut.done():
+        fut.set_result(event)
+
+
 @dataclass(slots=True)
 class OrderEvent:
+    """One state transition of an :class:`Order`.
+
+    ``info`` is shared by reference once the event is applied (order history,
+    tracking attempt records, observers, cached submit payloads), so it is never
+    mutated afterwards; readers may hold it without copying.
+    """
+
     state: OrderState
-    ts: float = field(default_factory=lambda: time.time())
+    ts: float = field(default_factory=time.time)
     info: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -37,6 +69,22 @@ class OrderEvent:
 class Order:
     """Represents a single order lifecycle and provides awaitable helpers."""
 
+    __slots__ = (
+        "venue",
+        "symbol",
+        "client_order_index",
+        "is_ask",
+        "trace_id",
+        "exchange_order_id",
+        "_state",
+        "_history",
+        "_loop",
+        "_final_future",
+        "_update_waiters",
+        "_log_dir",
+        "_log_path",
+    )
+
     def __init__(
         self,
         *,
@@ -55,11 +103,16 @@ class Order:
         self.exchange_order_id: Optional[str] = None
         self._state = OrderState.SUBMITTING
         self._history: List[OrderEvent] = []
-        self._loop = asyncio.get_event_loop()
-        self._final_future: asyncio.Future[OrderEvent] = self._loop.create_future()
-        self._update_waiters: List[asyncio.Future[OrderEvent]] = []
-        self._lock = asyncio.Lock()
+        # Loop and final future are bound lazily on first use so orders can be
+        # constructed without a running loop.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._final_future: Optional[asyncio.Future[OrderEvent]] = None
+        # Allocated on the first next_update(); most orders never have waiters.
+        self._update_waiters: Optional[List[asyncio.Future[OrderEvent]]] = None
         self._log_dir = log_dir
+        self._log_path = (
+            log_dir / f"{venue}-{symbol}-{client_order_index}.jsonl" if log_dir else None
+        )
 
     @property
     def state(self) -> OrderState:
@@ -72,15 +125,29 @@ class Order:
     def snapshot(self) -> OrderEvent:
         return self._history[-1] if self._history else OrderEvent(state=self._state)
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
+
+    def _get_final_future(self) -> asyncio.Future[OrderEvent]:
+        fut = self._final_future
+        if fut is None:
+            fut = self._final_future = self._get_loop().create_future()
+        return fut
+
     async def wait_final(self, timeout: Optional[float] = None) -> OrderEvent:
-        fut = asyncio.shield(self._final_future)
+        fut = asyncio.shield(self._get_final_future())
         if timeout is not None:
             return await asyncio.wait_for(fut, timeout)
         return await fut
 
     async def next_update(self, timeout: Optional[float] = None) -> OrderEvent:
-        waiter: asyncio.Future[OrderEvent] = self._loop.create_future()
-        async with self._lock:
+        waiter: asyncio.Future[OrderEvent] = self._get_loop().create_future()
+        if self._update_waiters is None:
+            self._update_waiters = [waiter]
+        else:
             self._update_waiters.append(waiter)
         fut = asyncio.shield(waiter)
         if timeout is not None:
@@ -88,37 +155,43 @@ class Order:
         return await fut
 
     async def apply_update(self, event: OrderEvent, *, exchange_order_id: Optional[str] = None) -> OrderEvent:
-        async with self._lock:
-            if exchange_order_id:
-                self.exchange_order_id = exchange_order_id
-            self._state = event.state
-            self._history.append(event)
-            for waiter in self._update_waiters:
-                if not waiter.done():
-                    waiter.set_result(event)
-            self._update_waiters.clear()
-            if event.state in FINAL_STATES and not self._final_future.done():
-                self._final_future.set_result(event)
-            if self._log_dir:
-                self._persist_event(event)
+        # No awaits below, so the update is atomic with respect to other tasks.
+        if exchange_order_id:
+            self.exchange_order_id = exchange_order_id
+        self._state = event.state
+        self._history.append(event)
+        # Resolve waiters on the next loop iteration so bursts of updates do not
+        # run every waiter's callbacks inline with the caller.
+        waiters = self._update_waiters
+        if waiters:
+            loop = self._get_loop()
+            for waiter in waiters:
+                loop.call_soon(_resolve, waiter, event)
+            self._update_waiters = None
+        if event.state in FINAL_STATES:
+            self._get_loop().call_soon(_resolve, self._get_final_future(), event)
+        if self._log_dir:
+            self._persist_event(event)
         return event
 
     def _persist_event(self, event: OrderEvent) -> None:
+        log_dir = self._log_dir
         try:
-            self._log_dir.mkdir(parents=True, exist_ok=True)
-            filename = f"{self.venue}-{self.symbol}-{self.client_order_index}.jsonl"
-            target = self._log_dir / filename
+            if log_dir not in _READY_DIRS:
+                log_dir.mkdir(parents=True, exist_ok=True)
+                _READY_DIRS.add(log_dir)
             payload: Dict[str, Any] = {
                 "trace_id": self.trace_id,
                 "client_order_index": self.client_order_index,
                 "exchange_order_id": self.exchange_order_id,
                 **event.to_dict(),
             }
-            with target.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(payload, ensure_ascii=True) + "\n")
+            with self._log_path.open("ab") as handle:
+                handle.write(_encode_line(payload))
         except Exception:
             # Persistence must never break state propagation; defer to logging layer.
-            pass
+            # Forget the directory so a removed one is recreated on the next event.
+            _READY_DIRS.discard(log_dir)
 
 
 __all__ = ["OrderState", "FINAL_STATES", "OrderEvent", "Order"]
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from xbot.connector.interface import IConnector
 
 from .market_data_service import MarketDataService
-from .models import Order, OrderEvent, OrderState
+from .models import FINAL_STATES, Order, OrderEvent, OrderState
 from .risk_service import RiskService
 from .tracking_limit import TrackingLimitEngine, TrackingLimitOrder
 from ..utils.idgen import ClientOrderIdGenerator
@@ -27,6 +29,36 @@ class UnknownOrderError(KeyError):
     pass
 
 
+# (symbol, size_i, price_i, is_ask, post_only, reduce_only, decimals, min_size_i)
+_OrderShape = Tuple[str, int, int, bool, bool, int, Tuple[int, int], int]
+
+_SHAPE_CACHE_SIZE = 256
+
+# Connector/exchange-specific get_order status strings normalized to our enum.
+_FETCHED_STATES: Dict[str, OrderState] = {
+    "new": OrderState.OPEN,
+    "accepted": OrderState.OPEN,
+    "active": OrderState.OPEN,
+    "open": OrderState.OPEN,
+    "partially_filled": OrderState.PARTIALLY_FILLED,
+    "partial": OrderState.PARTIALLY_FILLED,
+    "filled": OrderState.FILLED,
+    "done": OrderState.FILLED,
+    "closed": OrderState.FILLED,
+    "cancel": OrderState.CANCELLED,
+    "canceled": OrderState.CANCELLED,
+    "cancelled": OrderState.CANCELLED,
+    "rejected": OrderState.FAILED,
+    "failed": OrderState.FAILED,
+    "error": OrderState.FAILED,
+    "pending": OrderState.SUBMITTING,
+    "queued": OrderState.SUBMITTING,
+}
+
+# Seconds a finished order stays queryable before it is dropped from tracking.
+FINISHED_ORDER_TTL = 300.0
+
+
 class OrderService:
     """Centralised order flow coordination for a single venue."""
 
@@ -38,6 +70,7 @@ class OrderService:
         risk_service: RiskService,
         tracking_engine: TrackingLimitEngine,
         log_root: Path | None = None,
+        finished_ttl: float = FINISHED_ORDER_TTL,
     ) -> None:
         self._connector = connector
         self._market_data = market_data
@@ -45,18 +78,112 @@ class OrderService:
         self._tracking = tracking_engine
         self._log_root = log_root or Path("logs/orders")
         self._generator = ClientOrderIdGenerator()
+        self._next_coi = self._generator.next
         self._orders: Dict[int, Order] = {}
-        self._lock = asyncio.Lock()
+        # Secondary index for venue updates that carry only the exchange order id.
+        self._by_exchange_id: Dict[object, Order] = {}
+        # Orders in a final state, oldest first, so pruning touches only expired
+        # entries and never scans live orders.
+        self._finished: Deque[Tuple[float, Order]] = deque()
+        self._finished_ttl = finished_ttl
+        # Limit-order shapes that already passed full risk validation, mapped to the
+        # shared SUBMITTING info dict. Entries are read-only once cached.
+        self._shapes: OrderedDict[_OrderShape, Dict[str, object]] = OrderedDict()
+
+    async def _submitting_info(
+        self,
+        *,
+        symbol: str,
+        size_i: int,
+        price_i: int,
+        is_ask: bool,
+        post_only: bool,
+        reduce_only: int,
+    ) -> Dict[str, object]:
+        # The verdict also depends on the symbol's metadata; both reads are memoized.
+        # After MarketDataService.invalidate() picks up new values, the key changes
+        # and the shape is validated in full again.
+        market_data = self._market_data
+        decimals = await market_data.get_price_size_decimals(symbol)
+        minimum = await market_data.get_min_size_i(symbol)
+        shape = (symbol, size_i, price_i, is_ask, post_only, reduce_only, decimals, minimum)
+        info = self._shapes.get(shape)
+        if info is not None:
+            # Size/notional checks are deterministic for a known shape; only the
+            # position check depends on live state.
+            self._shapes.move_to_end(shape)
+            await self._risk.validate_position(symbol=symbol, size_i=size_i, is_ask=is_ask)
+            return info
+        await self._risk.validate_order(symbol=symbol, size_i=size_i, is_ask=is_ask, price_i=price_i)
+        info = {
+            "size_i": size_i,
+            "price_i": price_i,
+            "is_ask": is_ask,
+            "symbol": symbol,
+        }
+        self._shapes[shape] = info
+        if len(self._shapes) > _SHAPE_CACHE_SIZE:
+            self._shapes.popitem(last=False)
+        return info
 
-    async def _register(self, order: Order) -> None:
-        async with self._lock:
-            self._orders[order.client_order_index] = order
+    @property
+    def connector(self) -> IConnector:
+        return self._connector
 
-    async def _get(self, client_order_index: int) -> Order:
-        async with self._lock:
-            if client_order_index not in self._orders:
-                raise UnknownOrderError(client_order_index)
+    # All order bookkeeping runs on the event loop thread and never awaits while
+    # touching ``_orders``, so plain dict access is sufficient.
+    def _register(self, order: Order) -> None:
+        self._prune_finished()
+        self._orders[order.client_order_index] = order
+
+    def _note_final(self, order: Order) -> None:
+        if order.state in FINAL_STATES:
+            self._finished.append((time.monotonic(), order))
+
+    def _prune_finished(self) -> None:
+        finished = self._finished
+        if not finished:
+            return
+        cutoff = time.monotonic() - self._finished_ttl
+        while finished and finished[0][0] <= cutoff:
+            _, order = finished.popleft()
+            # The order may have been re-registered or revived by a late update.
+            if order.state not in FINAL_STATES:
+                continue
+            # pop() removes in one probe; in the rare case the slot now holds a
+            # different order (id reuse), put that one back.
+            coi = order.client_order_index
+            current = self._orders.pop(coi, None)
+            if current is not None and current is not order:
+                self._orders[coi] = current
+            eid = order.exchange_order_id
+            if eid:
+                current = self._by_exchange_id.pop(eid, None)
+                if current is not None and current is not order:
+                    self._by_exchange_id[eid] = current
+
+    def _index_exchange_id(self, order: Order) -> None:
+        if order.exchange_order_id:
+            self._by_exchange_id[order.exchange_order_id] = order
+
+    async def _mark_open(self, order: Order, exchange_order_id: str, info: Dict[str, object]) -> None:
+        # The order is registered before the submit RPC, so a WS update can reach it
+        # while that RPC is in flight. Only promote it from SUBMITTING; never move a
+        # fill or cancel that already arrived back to OPEN.
+        if order.state is OrderState.SUBMITTING:
+            await order.apply_update(
+                OrderEvent(state=OrderState.OPEN, info=info),
+                exchange_order_id=exchange_order_id,
+            )
+        elif exchange_order_id and not order.exchange_order_id:
+            order.exchange_order_id = exchange_order_id
+        self._index_exchange_id(order)
+
+    def _get(self, client_order_index: int) -> Order:
+        try:
             return self._orders[client_order_index]
+        except KeyError:
+            raise UnknownOrderError(client_order_index) from None
 
     async def submit_limit(
         self,
@@ -80,8 +207,15 @@ class OrderService:
             size_i = await self._market_data.to_size_i(symbol, size)
         if price_i is None:
             price_i = await self._market_data.to_price_i(symbol, price)
-        await self._risk.validate_order(symbol=symbol, size_i=size_i, is_ask=is_ask, price_i=price_i)
-        coi = client_order_index or self._generator.next()
+        info = await self._submitting_info(
+            symbol=symbol,
+            size_i=size_i,
+            price_i=price_i,
+            is_ask=is_ask,
+            post_only=post_only,
+            reduce_only=reduce_only,
+        )
+        coi = client_order_index or self._next_coi()
         venue_symbol = self._market_data.resolve_symbol(symbol)
         order = Order(
             venue=self._connector.venue,
@@ -91,18 +225,8 @@ class OrderService:
             log_dir=self._log_root,
             trace_id=trace_id,
         )
-        await self._register(order)
-        await order.apply_update(
-            OrderEvent(
-                state=OrderState.SUBMITTING,
-                info={
-                    "size_i": size_i,
-                    "price_i": price_i,
-                    "is_ask": is_ask,
-                    "symbol": symbol,
-                },
-            )
-        )
+        self._register(order)
+        await order.apply_update(OrderEvent(state=OrderState.SUBMITTING, info=info))
         try:
             exchange_order_id = await self._connector.submit_limit_order(
                 symbol=venue_symbol,
@@ -120,17 +244,16 @@ class OrderService:
                     info={"error": str(exc)}
                 )
             )
+            self._note_final(order)
             raise
-        await order.apply_update(
-            OrderEvent(
-                state=OrderState.OPEN,
-                info={
-                    "exchange_order_id": exchange_order_id,
-                    "size_i": size_i,
-                    "price_i": price_i,
-                },
-            ),
-            exchange_order_id=exchange_order_id,
+        await self._mark_open(
+            order,
+            exchange_order_id,
+            {
+                "exchange_order_id": exchange_order_id,
+                "size_i": size_i,
+                "price_i": price_i,
+            },
         )
         return order
 
@@ -150,7 +273,7 @@ class OrderService:
         if size_i is None:
             size_i = await self._market_data.to_size_i(symbol, size)
         await self._risk.validate_order(symbol=symbol, size_i=size_i, is_ask=is_ask)
-        coi = client_order_index or self._generator.next()
+        coi = client_order_index or self._next_coi()
         venue_symbol = self._market_data.resolve_symbol(symbol)
         order = Order(
             venue=self._connector.venue,
@@ -160,7 +283,7 @@ class OrderService:
             log_dir=self._log_root,
             trace_id=trace_id,
         )
-        await self._register(order)
+        self._register(order)
         await order.apply_update(
             OrderEvent(
                 state=OrderState.SUBMITTING,
@@ -182,21 +305,20 @@ class OrderService:
                     info={"error": str(exc)},
                 )
             )
+            self._note_final(order)
             raise
-        await order.apply_update(
-            OrderEvent(
-                state=OrderState.OPEN,
-                info={
-                    "exchange_order_id": exchange_order_id,
-                    "size_i": size_i,
-                },
-            ),
-            exchange_order_id=exchange_order_id,
+        await self._mark_open(
+            order,
+            exchange_order_id,
+            {
+                "exchange_order_id": exchange_order_id,
+                "size_i": size_i,
+            },
         )
         return order
 
     async def cancel(self, symbol: str, client_order_index: int) -> None:
-        order = await self._get(client_order_index)
+        order = self._get(client_order_index)
         venue_symbol = self._market_data.resolve_symbol(symbol)
         resp: Dict[str, object]
         if order.exchange_order_id:
@@ -214,6 +336,21 @@ class OrderService:
                 },
             )
         )
+        self._note_final(order)
+
+    async def cancel_many(
+        self, symbol: str, client_order_indices: Iterable[int]
+    ) -> List[Optional[BaseException]]:
+        """Cancel several orders concurrently.
+
+        Returns one entry per index, in order: ``None`` on success or the
+        exception raised by that cancel.
+        """
+        results = await asyncio.gather(
+            *(self.cancel(symbol, coi) for coi in client_order_indices),
+            return_exceptions=True,
+        )
+        return [result if isinstance(result, BaseException) else None for result in results]
 
     async def place_tracking_limit(
         self,
@@ -236,25 +373,23 @@ class OrderService:
     async def ingest_update(self, payload: OrderUpdatePayload) -> Order:
         # Primary: by client_order_index
         try:
-            order = await self._get(payload.client_order_index)
+            order = self._get(payload.client_order_index)
         except UnknownOrderError:
             # Fallback: when venue ws doesn't carry client id (e.g., 0), match by exchange_order_id
-            if payload.exchange_order_id:
-                # Linear scan over small in-flight set
-                async with self._lock:
-                    candidates = [o for o in self._orders.values() if o.exchange_order_id == payload.exchange_order_id]
-                if not candidates:
-                    # As a last resort, accept match when only one open order exists
-                    async with self._lock:
-                        open_orders = [o for o in self._orders.values()]
-                    if len(open_orders) == 1:
-                        order = open_orders[0]
-                    else:
-                        raise
-                else:
-                    order = candidates[0]
-            else:
+            if not payload.exchange_order_id:
                 raise
+            order = self._by_exchange_id.get(payload.exchange_order_id)
+            if order is None:
+                # As a last resort, hand an update that carries no client id to the
+                # only tracked order, if that order has not been acked yet. Pruning
+                # keeps the table small, so anything looser would route late updates
+                # for forgotten orders (or fetches by a stale client id) to an
+                # unrelated live order.
+                if payload.client_order_index or len(self._orders) != 1:
+                    raise
+                order = next(iter(self._orders.values()))
+                if order.exchange_order_id:
+                    raise
         await order.apply_update(
             OrderEvent(
                 state=payload.state,
@@ -262,6 +397,8 @@ class OrderService:
             ),
             exchange_order_id=payload.exchange_order_id,
         )
+        self._index_exchange_id(order)
+        self._note_final(order)
         return order
 
     async def fetch_order(self, symbol: str, client_order_index: int) -> Order:
@@ -271,27 +408,7 @@ class OrderService:
         if not state_str:
             raise ValueError("connector get_order response missing state/status")
 
-        # Normalize various connector/exchange-specific status strings to our enum
-        normalized_map = {
-            "new": OrderState.OPEN,
-            "accepted": OrderState.OPEN,
-            "active": OrderState.OPEN,
-            "open": OrderState.OPEN,
-            "partially_filled": OrderState.PARTIALLY_FILLED,
-            "partial": OrderState.PARTIALLY_FILLED,
-            "filled": OrderState.FILLED,
-            "done": OrderState.FILLED,
-            "closed": OrderState.FILLED,
-            "cancel": OrderState.CANCELLED,
-            "canceled": OrderState.CANCELLED,
-            "cancelled": OrderState.CANCELLED,
-            "rejected": OrderState.FAILED,
-            "failed": OrderState.FAILED,
-            "error": OrderState.FAILED,
-            "pending": OrderState.SUBMITTING,
-            "queued": OrderState.SUBMITTING,
-        }
-        state = normalized_map.get(state_str)
+        state = _FETCHED_STATES.get(state_str)
         if state is None:
             # Fallback to direct enum conversion if it already matches
             state = OrderState(state_str)
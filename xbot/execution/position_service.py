@@ -2,9 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, Iterable, Optional
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+# Recent snapshots retained per symbol for PnL/risk analysis.
+HISTORY_SIZE = 128
+# Pending snapshots buffered per stream subscriber; the oldest is dropped when full.
+STREAM_QUEUE_SIZE = 256
 
 
 @dataclass(slots=True)
@@ -20,21 +26,69 @@ class PositionSnapshot:
 class PositionService:
     """Aggregates position information from exchange feeds."""
 
-    def __init__(self) -> None:
-        self._positions: Dict[str, PositionSnapshot] = {}
+    def __init__(
+        self,
+        *,
+        history_size: int = HISTORY_SIZE,
+        stream_queue_size: int = STREAM_QUEUE_SIZE,
+    ) -> None:
+        self._history_size = history_size
+        self._stream_queue_size = stream_queue_size
+        # (queue, symbol filter) per active stream() consumer.
+        self._subscribers: List[Tuple[asyncio.Queue[PositionSnapshot], Optional[str]]] = []
+        self._positions: Dict[str, Deque[PositionSnapshot]] = {}
+        # Latest snapshot per symbol, rebuilt lazily after ingest/reset so
+        # repeated reads between updates share one immutable tuple.
+        self._latest: Optional[Tuple[PositionSnapshot, ...]] = None
         self._lock = asyncio.Lock()
 
     async def ingest(self, snapshot: PositionSnapshot) -> None:
         async with self._lock:
-            self._positions[snapshot.symbol] = snapshot
+            history = self._positions.get(snapshot.symbol)
+            if history is None:
+                history = self._positions[snapshot.symbol] = deque(maxlen=self._history_size)
+            history.append(snapshot)
+            self._latest = None
+        for queue, symbol in self._subscribers:
+            if symbol is not None and symbol != snapshot.symbol:
+                continue
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
 
     async def get_position(self, symbol: str) -> Optional[PositionSnapshot]:
         async with self._lock:
-            return self._positions.get(symbol)
+            history = self._positions.get(symbol)
+            return history[-1] if history else None
+
+    async def get_history(self, symbol: str) -> List[PositionSnapshot]:
+        """Return retained snapshots for ``symbol``, oldest first."""
+        async with self._lock:
+            return list(self._positions.get(symbol, ()))
 
-    async def all_positions(self) -> Iterable[PositionSnapshot]:
+    async def all_positions(self) -> Tuple[PositionSnapshot, ...]:
         async with self._lock:
-            return list(self._positions.values())
+            latest = self._latest
+            if latest is None:
+                latest = self._latest = tuple(
+                    history[-1] for history in self._positions.values() if history
+                )
+            return latest
+
+    async def stream(self, symbol: Optional[str] = None) -> AsyncIterator[PositionSnapshot]:
+        """Yield snapshots as they are ingested, optionally only for ``symbol``.
+
+        Consumers that fall behind lose the oldest pending snapshots first.
+        Close the iterator (e.g. ``contextlib.aclosing``) to unsubscribe promptly.
+        """
+        queue: asyncio.Queue[PositionSnapshot] = asyncio.Queue(maxsize=self._stream_queue_size)
+        entry = (queue, symbol)
+        self._subscribers.append(entry)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.remove(entry)
 
     async def reset(self, symbol: Optional[str] = None) -> None:
         async with self._lock:
@@ -42,6 +96,7 @@ class PositionService:
                 self._positions.clear()
             else:
                 self._positions.pop(symbol, None)
+            self._latest = None
 
 
 __all__ = ["PositionService", "PositionSnapshot"]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import math
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from .market_data_service import MarketDataService
 from .position_service import PositionService
@@ -12,12 +14,16 @@ class RiskViolationError(Exception):
     """Raised when requested action would violate a risk constraint."""
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RiskLimits:
     max_position: Optional[Decimal] = None
     max_notional: Optional[Decimal] = None
 
 
+# Shared "no limits" instance; RiskLimits is immutable so one copy serves everyone.
+DEFAULT_RISK_LIMITS = RiskLimits()
+
+
 class RiskService:
     def __init__(
         self,
@@ -28,7 +34,9 @@ class RiskService:
     ) -> None:
         self._market_data = market_data
         self._position_service = position_service
-        self._limits = limits or RiskLimits()
+        self._limits = limits or DEFAULT_RISK_LIMITS
+        # Integer-unit limits per (price_decimals, size_decimals); see _scaled_limits.
+        self._scaled: Dict[Tuple[int, int], Tuple[Optional[int], Optional[int]]] = {}
 
     async def validate_order(
         self,
@@ -38,32 +46,163 @@ class RiskService:
         is_ask: bool,
         price_i: Optional[int] = None,
     ) -> None:
-        await self._market_data.ensure_min_size(symbol, size_i)
+        if self._limits.max_notional is not None and price_i is None:
+            # The reference-price fetch is the only network round-trip here; start it
+            # now so it overlaps the cheaper checks, and drop it if one of them fails.
+            book = asyncio.ensure_future(self._market_data.get_top_of_book(symbol))
+            try:
+                await self._validate_order(symbol=symbol, size_i=size_i, is_ask=is_ask, price_i=None, book=book)
+            finally:
+                if not book.done():
+                    book.cancel()
+                elif not book.cancelled():
+                    book.exception()  # retrieved, in case an earlier check failed first
+            return
+        await self._validate_order(symbol=symbol, size_i=size_i, is_ask=is_ask, price_i=price_i, book=None)
+
+    async def _validate_order(
+        self,
+        *,
+        symbol: str,
+        size_i: int,
+        is_ask: bool,
+        price_i: Optional[int],
+        book: Optional[asyncio.Future[Tuple[Optional[int], Optional[int], int]]],
+    ) -> None:
+        # The checks below are inlined rather than split into coroutine helpers, so
+        # the only awaits are the ones that may actually suspend.
+        minimum = await self._market_data.get_min_size_i(symbol)
+        if size_i < minimum:
+            raise ValueError(f"size {size_i} below minimum {minimum} for {symbol}")
         if self._limits.max_position is None and self._limits.max_notional is None:
             return
-        price_decimals, size_decimals = await self._market_data.get_price_size_decimals(symbol)
-        size = Decimal(size_i) / (Decimal(10) ** size_decimals)
-        if self._limits.max_position is not None:
+        decimals = await self._market_data.get_price_size_decimals(symbol)
+        position_i, notional_i = self._scaled_limits(decimals)
+        if position_i is not None:
             existing = await self._position_service.get_position(symbol)
-            net_base = existing.base_qty if existing else Decimal(0)
-            future_base = net_base - size if is_ask else net_base + size
-            if abs(future_base) > self._limits.max_position:
-                raise RiskViolationError(
-                    f"net base {future_base} exceeds limit {self._limits.max_position} for {symbol}"
-                )
-        if self._limits.max_notional is not None:
+            net_base_i = existing.base_qty.scaleb(decimals[1]) if existing else 0
+            error = self._position_error(symbol, net_base_i, size_i, is_ask, decimals)
+            if error is not None:
+                raise error
+        if notional_i is not None:
             if price_i is None:
-                bid_i, ask_i, _scale = await self._market_data.get_top_of_book(symbol)
+                bid_i, ask_i, _scale = await book
                 reference = ask_i if not is_ask else bid_i
                 if reference is None:
                     raise RiskViolationError("unable to determine reference price for notional risk check")
                 price_i = reference
-            price = Decimal(price_i) / (Decimal(10) ** price_decimals)
-            notional = price * size
-            if notional > self._limits.max_notional:
-                raise RiskViolationError(
-                    f"order notional {notional} exceeds limit {self._limits.max_notional}"
-                )
+            error = self._notional_error(price_i * size_i, decimals)
+            if error is not None:
+                raise error
+
+    async def validate_orders(
+        self,
+        *,
+        symbol: str,
+        orders: Sequence[Tuple[int, bool, Optional[int]]],
+    ) -> List[Optional[Exception]]:
+        """Validate several ``(size_i, is_ask, price_i)`` orders for one symbol.
+
+        Metadata, the current position and the reference price are fetched once
+        for the whole batch. Each order is checked on its own against the current
+        position, as with separate ``validate_order`` calls. Returns ``None`` or
+        the violation for each order, in order.
+        """
+        limits = self._limits
+        minimum = await self._market_data.get_min_size_i(symbol)
+        position_i = notional_i = None
+        if limits.max_position is not None or limits.max_notional is not None:
+            decimals = await self._market_data.get_price_size_decimals(symbol)
+            position_i, notional_i = self._scaled_limits(decimals)
+        net_base_i: Decimal | int = 0
+        if position_i is not None:
+            existing = await self._position_service.get_position(symbol)
+            if existing:
+                net_base_i = existing.base_qty.scaleb(decimals[1])
+        book: Optional[Tuple[Optional[int], Optional[int], int]] = None
+        results: List[Optional[Exception]] = []
+        for size_i, is_ask, price_i in orders:
+            if size_i < minimum:
+                results.append(ValueError(f"size {size_i} below minimum {minimum} for {symbol}"))
+                continue
+            error: Optional[Exception] = None
+            if position_i is not None:
+                error = self._position_error(symbol, net_base_i, size_i, is_ask, decimals)
+            if error is None and notional_i is not None:
+                if price_i is None:
+                    if book is None:
+                        book = await self._market_data.get_top_of_book(symbol)
+                    price_i = book[1] if not is_ask else book[0]
+                if price_i is None:
+                    error = RiskViolationError("unable to determine reference price for notional risk check")
+                else:
+                    error = self._notional_error(price_i * size_i, decimals)
+            results.append(error)
+        return results
+
+    async def validate_position(self, *, symbol: str, size_i: int, is_ask: bool) -> None:
+        """Re-run only the position-dependent check for an already validated order shape."""
+        if self._limits.max_position is None:
+            return
+        decimals = await self._market_data.get_price_size_decimals(symbol)
+        existing = await self._position_service.get_position(symbol)
+        net_base_i = existing.base_qty.scaleb(decimals[1]) if existing else 0
+        error = self._position_error(symbol, net_base_i, size_i, is_ask, decimals)
+        if error is not None:
+            raise error
+
+    def _scaled_limits(self, decimals: Tuple[int, int]) -> Tuple[Optional[int], Optional[int]]:
+        """Return ``(max_position, max_notional)`` in the integer units of ``decimals``.
+
+        Sizes and prices arrive as integers, and for an integer ``x`` the test
+        ``x > limit`` is the same as ``x > floor(limit)``. Each limit is scaled
+        and floored once per precision, so the checks compare ints and skip the
+        Decimal division. The net position can carry more precision than the
+        size step, so ``_position_error`` confirms a breach against the exact limit.
+        """
+        try:
+            return self._scaled[decimals]
+        except KeyError:
+            pass
+        price_decimals, size_decimals = decimals
+        limits = self._limits
+        position_i = (
+            None if limits.max_position is None else math.floor(limits.max_position.scaleb(size_decimals))
+        )
+        notional_i = (
+            None
+            if limits.max_notional is None
+            else math.floor(limits.max_notional.scaleb(price_decimals + size_decimals))
+        )
+        scaled = self._scaled[decimals] = (position_i, notional_i)
+        return scaled
+
+    def _position_error(
+        self,
+        symbol: str,
+        net_base_i: Decimal | int,
+        size_i: int,
+        is_ask: bool,
+        decimals: Tuple[int, int],
+    ) -> Optional[RiskViolationError]:
+        future_i = net_base_i - size_i if is_ask else net_base_i + size_i
+        magnitude = abs(future_i)
+        # The floored limit is exact for integer positions. A fractional position
+        # can exceed it and still be within the real limit, so confirm against that.
+        if magnitude > self._scaled_limits(decimals)[0] and magnitude > self._limits.max_position.scaleb(decimals[1]):
+            future_base = Decimal(future_i).scaleb(-decimals[1])
+            return RiskViolationError(
+                f"net base {future_base} exceeds limit {self._limits.max_position} for {symbol}"
+            )
+        return None
+
+    def _notional_error(self, notional_i: int, decimals: Tuple[int, int]) -> Optional[RiskViolationError]:
+        if notional_i > self._scaled_limits(decimals)[1]:
+            notional = Decimal(notional_i).scaleb(-(decimals[0] + decimals[1]))
+            return RiskViolationError(
+                f"order notional {notional} exceeds limit {self._limits.max_notional}"
+            )
+        return None
 
 
-__all__ = ["RiskService", "RiskLimits", "RiskViolationError"]
+__all__ = ["RiskService", "RiskLimits", "RiskViolationError", "DEFAULT_RISK_LIMITS"]
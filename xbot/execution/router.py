@@ -1,19 +1,60 @@
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, TYPE_CHECKING
 
 from .order_service import OrderService
 from .position_service import PositionService
 from .risk_service import RiskService
-from .tracking_limit import TrackingLimitOrder
-from .models import Order
 from .market_data_service import MarketDataService
-from ..core.cache import MarketCache
+
+if TYPE_CHECKING:
+    from .models import Order
+    from .tracking_limit import TrackingLimitOrder
+    from ..core.cache import MarketCache
+
+
+# Account snapshots younger than ACCOUNT_SNAPSHOT_MAX_AGE are served as-is;
+# up to ACCOUNT_SNAPSHOT_STALE_AGE they are served while a refresh runs.
+ACCOUNT_SNAPSHOT_MAX_AGE = 1.0
+ACCOUNT_SNAPSHOT_STALE_AGE = 5.0
+
+
+@dataclass(slots=True)
+class AccountSnapshot:
+    positions: List[Dict[str, Any]]
+    margin: Dict[str, Any]
+    ts: float
+    errors: Dict[str, BaseException] = field(default_factory=dict)
 
 
 class ExecutionRouter:
     """Thin facade exposing venue execution services to strategies."""
 
+    __slots__ = (
+        "_orders",
+        "_positions",
+        "_risk",
+        "_market_data",
+        "_cache",
+        "_account_max_age",
+        "_account_stale_age",
+        "_account",
+        "_account_refresh",
+        "_account_gen",
+        "_account_tasks",
+        "_submit_limit",
+        "_submit_market",
+        "_cancel",
+        "_cancel_many",
+        "_place_tracking_limit",
+        "_fetch_order",
+        "_fetch_positions",
+        "_fetch_margin",
+    )
+
     def __init__(
         self,
         *,
@@ -22,12 +63,32 @@ class ExecutionRouter:
         risk_service: RiskService,
         market_data: MarketDataService,
         cache: MarketCache | None = None,
+        account_max_age: float = ACCOUNT_SNAPSHOT_MAX_AGE,
+        account_stale_age: float = ACCOUNT_SNAPSHOT_STALE_AGE,
     ) -> None:
         self._orders = order_service
         self._positions = position_service
         self._risk = risk_service
         self._market_data = market_data
         self._cache = cache
+        self._account_max_age = account_max_age
+        self._account_stale_age = max(account_stale_age, account_max_age)
+        self._account: Optional[AccountSnapshot] = None
+        self._account_refresh: Optional[asyncio.Task] = None
+        self._account_gen = 0
+        # Strong references to every refresh still in flight, including ones an
+        # invalidate_account() detached, so stop() can cancel them.
+        self._account_tasks: Set[asyncio.Task] = set()
+        # Bound once so each delegated call is a single attribute load and the
+        # service coroutine is returned as-is, without a wrapper coroutine.
+        self._submit_limit = order_service.submit_limit
+        self._submit_market = order_service.submit_market
+        self._cancel = order_service.cancel
+        self._cancel_many = order_service.cancel_many
+        self._place_tracking_limit = order_service.place_tracking_limit
+        self._fetch_order = order_service.fetch_order
+        self._fetch_positions = order_service.connector.get_positions
+        self._fetch_margin = order_service.connector.get_margin
 
     @property
     def risk(self) -> RiskService:
@@ -49,24 +110,100 @@ class ExecutionRouter:
     def cache(self) -> MarketCache | None:
         return self._cache
 
-    async def submit_limit(self, **kwargs) -> Order:
-        return await self._orders.submit_limit(**kwargs)
-
-    async def submit_market(self, **kwargs) -> Order:
-        return await self._orders.submit_market(**kwargs)
-
-    async def cancel(self, symbol: str, client_order_index: int) -> None:
-        await self._orders.cancel(symbol, client_order_index)
-
-    async def tracking_limit(self, **kwargs) -> TrackingLimitOrder:
-        return await self._orders.place_tracking_limit(**kwargs)
-
-    async def fetch_order(self, symbol: str, client_order_index: int) -> object:
-        return await self._orders.fetch_order(symbol, client_order_index)
+    def submit_limit(self, **kwargs) -> Awaitable[Order]:
+        return self._submit_limit(**kwargs)
+
+    def submit_market(self, **kwargs) -> Awaitable[Order]:
+        return self._submit_market(**kwargs)
+
+    def cancel(self, symbol: str, client_order_index: int) -> Awaitable[None]:
+        return self._cancel(symbol, client_order_index)
+
+    def cancel_many(
+        self, symbol: str, client_order_indices: Iterable[int]
+    ) -> Awaitable[List[Optional[BaseException]]]:
+        return self._cancel_many(symbol, client_order_indices)
+
+    def tracking_limit(self, **kwargs) -> Awaitable[TrackingLimitOrder]:
+        return self._place_tracking_limit(**kwargs)
+
+    def fetch_order(self, symbol: str, client_order_index: int) -> Awaitable[Order]:
+        return self._fetch_order(symbol, client_order_index)
+
+    async def fetch_account(self) -> AccountSnapshot:
+        """Return positions and margin fetched together in one concurrent round-trip.
+
+        Snapshots younger than ``account_max_age`` are returned directly. Older
+        ones, up to ``account_stale_age``, are returned while a background
+        refresh is scheduled; beyond that the caller waits for a live fetch.
+        Concurrent refreshes share one round-trip. Failed legs fall back to
+        empty values and are recorded in ``errors``; such snapshots are not
+        reused.
+        """
+        snapshot = self._account
+        if snapshot is not None:
+            age = time.monotonic() - snapshot.ts
+            if age <= self._account_max_age:
+                return snapshot
+            if age <= self._account_stale_age:
+                self._refresh_account()
+                return snapshot
+        return await asyncio.shield(self._refresh_account())
+
+    def invalidate_account(self) -> None:
+        """Drop the cached account snapshot, e.g. after a fill."""
+        self._account = None
+        self._account_refresh = None
+        self._account_gen += 1
+
+    def _refresh_account(self) -> asyncio.Task:
+        task = self._account_refresh
+        if task is None or task.done():
+            task = self._account_refresh = asyncio.ensure_future(self._load_account())
+            self._account_tasks.add(task)
+            task.add_done_callback(self._account_tasks.discard)
+        return task
+
+    async def stop(self) -> None:
+        """Cancel account refreshes still in flight and wait for them to finish."""
+        tasks = list(self._account_tasks)
+        self._account_refresh = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load_account(self) -> AccountSnapshot:
+        gen = self._account_gen
+        positions, margin = await asyncio.gather(
+            self._fetch_positions(),
+            self._fetch_margin(),
+            return_exceptions=True,
+        )
+        snapshot = AccountSnapshot(positions=[], margin={}, ts=time.monotonic())
+        if isinstance(positions, BaseException):
+            snapshot.errors["positions"] = positions
+        else:
+            snapshot.positions = positions
+        if isinstance(margin, BaseException):
+            snapshot.errors["margin"] = margin
+        else:
+            snapshot.margin = margin
+        # A fill may have invalidated the account while this fetch was in flight.
+        if gen == self._account_gen:
+            self._account = None if snapshot.errors else snapshot
+        return snapshot
 
     async def fetch_margin(self) -> dict:
-        # Access underlying connector for margin snapshot when available
-        return await self._orders._connector.get_margin()  # type: ignore[attr-defined]
-
-
-__all__ = ["ExecutionRouter"]
+        snapshot = await self.fetch_account()
+        error = snapshot.errors.get("margin")
+        if error is not None:
+            raise error
+        return snapshot.margin
+
+
+__all__ = [
+    "ExecutionRouter",
+    "AccountSnapshot",
+    "ACCOUNT_SNAPSHOT_MAX_AGE",
+    "ACCOUNT_SNAPSHOT_STALE_AGE",
+]
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+from decimal import Decimal, InvalidOperation
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from xbot.connector.interface import IConnector
 
 from .market_data_service import MarketDataService
-from .models import Order, OrderState
+from .models import FINAL_STATES, Order, OrderState
 
 if TYPE_CHECKING:
     from .models import OrderEvent
     from .order_service import OrderService
 
 
+# Cumulative fill keys, in order of preference. Integer keys already hold base
+# units. Venue keys hold the executed base quantity as a decimal amount: Backpack
+# "z" (WS) / "executedQuantity" (REST), Lighter "filled_base_amount" / "filled".
+# Quote-denominated fields (Backpack "Z") must never be read as a fill size.
+_FILLED_INT_KEYS = ("filled_base_i", "filled_size_i")
+_FILLED_BASE_KEYS = ("z", "executedQuantity", "filled_base_amount", "filled")
+
+
+# Adaptive re-quote interval: EWMA weight of the latest drift sample and the
+# bounds applied to the resulting interval.
+_EWMA_ALPHA = 0.3
+_MIN_INTERVAL = 0.1
+_MAX_INTERVAL_FACTOR = 4.0
+
+
 class TrackingLimitTimeoutError(TimeoutError):
     pass
 
@@ -26,9 +41,15 @@ class TrackingAttempt:
     price_i: int
     state: OrderState
     info: Dict[str, object]
+    # Attempt outcome flags, kept apart from ``info`` so the venue payload is
+    # shared rather than copied per attempt.
+    timed_out: bool = False
+    cancel_wait_timeout: bool = False
 
 
 class TrackingLimitOrder:
+    __slots__ = ("_final_order", "attempts", "filled_base_i")
+
     def __init__(
         self,
         final_order: Order,
@@ -61,11 +82,15 @@ class TrackingLimitEngine:
         default_interval_secs: float = 10.0,
         default_timeout_secs: float = 120.0,
         cancel_wait_secs: float = 2.0,
+        target_drift_ticks: Optional[float] = None,
     ) -> None:
         self._market_data = market_data
         self._default_interval = default_interval_secs
         self._default_timeout = default_timeout_secs
         self._cancel_wait_secs = cancel_wait_secs
+        # When set, the re-quote interval adapts to how fast the reference price
+        # moves; see _adapt_interval. ``None`` keeps the fixed interval.
+        self._target_drift = target_drift_ticks
 
     async def place(
         self,
@@ -84,22 +109,35 @@ class TrackingLimitEngine:
         trace_id: Optional[str] = None,
         observer: Optional[Callable[[str, Dict[str, object]], Awaitable[None]]] = None,
     ) -> TrackingLimitOrder:
-        interval = interval_secs or self._default_interval
+        base_interval = interval = interval_secs or self._default_interval
+        ewma_drift = 0.0
         timeout = timeout_secs or self._default_timeout
-        deadline = time.monotonic() + timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         attempt = 0
         cumulative_filled = 0
         remaining = base_amount_i
+        tolerance = max(1, int(base_amount_i * 0.0001))
         records: List[TrackingAttempt] = []
+        # Quote already fetched for the next attempt, if any.
+        next_book: Optional[Tuple[Optional[int], Optional[int], int]] = None
+        # Venue fill amounts are scaled to base units with the symbol's size step.
+        _price_decimals, size_decimals = await self._market_data.get_price_size_decimals(symbol)
+        # Loop-invariant bound methods, resolved once per call.
+        top_of_book = self._market_data.get_top_of_book
+        submit_limit = order_service.submit_limit
+        extract_filled = self._extract_filled
 
         while True:
             attempt += 1
             if max_attempts and attempt > max_attempts:
                 raise TrackingLimitTimeoutError("max attempts reached before fill")
-            now = time.monotonic()
-            if now >= deadline:
+            if loop.time() >= deadline:
                 raise TrackingLimitTimeoutError("tracking limit timeout reached")
-            bid_i, ask_i, _scale = await self._market_data.get_top_of_book(symbol)
+            if next_book is None:
+                next_book = await top_of_book(symbol)
+            bid_i, ask_i, _scale = next_book
+            next_book = None
             reference = ask_i if is_ask else bid_i
             if reference is None:
                 raise RuntimeError("top of book unavailable for tracking limit")
@@ -117,7 +155,7 @@ class TrackingLimitEngine:
                         "symbol": symbol,
                     },
                 )
-            order = await order_service.submit_limit(
+            order = await submit_limit(
                 symbol=symbol,
                 is_ask=is_ask,
                 size_i=remaining,
@@ -126,42 +164,42 @@ class TrackingLimitEngine:
                 reduce_only=reduce_only,
                 trace_id=trace_id,
             )
-            wait_budget = max(0.0, min(interval, deadline - time.monotonic()))
+            enough_filled = max(1, remaining - tolerance)
             try:
-                update = await asyncio.wait_for(order.wait_final(), timeout=wait_budget)
-            except asyncio.TimeoutError:
-                await order_service.cancel(symbol, order.client_order_index)
-                try:
-                    update = await asyncio.wait_for(order.wait_final(), timeout=self._cancel_wait_secs)
-                except asyncio.TimeoutError:
-                    update = order.snapshot()
-                    update.info = {**update.info, "cancel_wait_timeout": True}
-                if observer is not None:
-                    await observer(
-                        "after_submit",
-                        {
-                            "attempt": attempt,
-                            "client_order_index": order.client_order_index,
-                            "price_i": price_i,
-                            "state": update.state.value,
-                            "info": update.info,
-                        },
-                    )
-                records.append(
-                    TrackingAttempt(
-                        attempt=attempt,
-                        client_order_index=order.client_order_index,
-                        price_i=price_i,
-                        state=update.state,
-                        info={**update.info, "timeout": True},
-                    )
-                )
-                filled = self._extract_filled(update.info)
-                cumulative_filled += filled
-                remaining = base_amount_i - cumulative_filled
-                if cumulative_filled > 0 and remaining <= max(1, int(base_amount_i * 0.0001)):
-                    return TrackingLimitOrder(order, records, cumulative_filled)
-                continue
+                while True:
+                    until = min(loop.time() + interval, deadline)
+                    update = await self._await_attempt(order, until, enough_filled, size_decimals)
+                    if update is not None:
+                        break
+                    # Window elapsed with the order resting. Re-quote only if the price
+                    # would change; otherwise keep the order and its queue position.
+                    next_book = await top_of_book(symbol)
+                    quote = next_book[1] if is_ask else next_book[0]
+                    if quote is None:
+                        break
+                    requote = quote + price_offset_ticks if is_ask else quote - price_offset_ticks
+                    drift = abs(requote - price_i)
+                    if self._target_drift is not None:
+                        ewma_drift = _EWMA_ALPHA * drift + (1 - _EWMA_ALPHA) * ewma_drift
+                        interval = self._adapt_interval(base_interval, ewma_drift)
+                    if drift or loop.time() >= deadline:
+                        break
+                    next_book = None
+            except asyncio.CancelledError:
+                # The caller gave up mid-attempt: do not leave the order resting.
+                await self._abandon(order_service, symbol, order)
+                raise
+            timed_out = update is None
+            cancelled = timed_out or update.state not in FINAL_STATES
+            settled = True
+            if cancelled:
+                # Window elapsed, or a partial fill already covers the order: cancel
+                # the rest instead of waiting out the interval. There is no quote
+                # fetch left to overlap with the cancel: an elapsed window already
+                # read the next quote to decide on it, and a covering fill ends the
+                # loop below.
+                seen = update or order.snapshot()
+                update, settled = await self._cancel_and_settle(order_service, symbol, order)
             if observer is not None:
                 await observer(
                     "after_submit",
@@ -171,6 +209,7 @@ class TrackingLimitEngine:
                         "price_i": price_i,
                         "state": update.state.value,
                         "info": update.info,
+                        "cancel_wait_timeout": not settled,
                     },
                 )
             records.append(
@@ -180,36 +219,106 @@ class TrackingLimitEngine:
                     price_i=price_i,
                     state=update.state,
                     info=update.info,
+                    timed_out=timed_out,
+                    cancel_wait_timeout=not settled,
                 )
             )
-            if update.state == OrderState.FILLED:
+            if cancelled:
+                # The local cancel event carries no fill data; keep what the last
+                # venue update reported.
+                filled = max(
+                    extract_filled(update.info, size_decimals),
+                    extract_filled(seen.info, size_decimals),
+                )
+                cumulative_filled += filled
+                remaining = base_amount_i - cumulative_filled
+                if cumulative_filled > 0 and remaining <= tolerance:
+                    return TrackingLimitOrder(order, records, cumulative_filled)
+                continue
+            state = update.state
+            if state is OrderState.FILLED:
                 cumulative_filled += remaining
                 return TrackingLimitOrder(order, records, cumulative_filled)
-            if update.state == OrderState.FAILED:
+            if state is OrderState.FAILED:
                 raise RuntimeError(f"tracking limit attempt failed: {update.info}")
-            filled = self._extract_filled(update.info)
-            cumulative_filled += filled
+            cumulative_filled += extract_filled(update.info, size_decimals)
             remaining = base_amount_i - cumulative_filled
-            if remaining <= max(1, int(base_amount_i * 0.0001)):
-                return TrackingLimitOrder(order, records, cumulative_filled)
-            if remaining <= 0:
+            if remaining <= tolerance:
                 return TrackingLimitOrder(order, records, cumulative_filled)
 
+    def _adapt_interval(self, base_interval: float, ewma_drift: float) -> float:
+        """Shorten the interval while the price runs away, lengthen it while quiet."""
+        interval = base_interval * self._target_drift / max(ewma_drift, 1.0)
+        return min(max(interval, _MIN_INTERVAL), base_interval * _MAX_INTERVAL_FACTOR)
+
     @staticmethod
-    def _extract_filled(info: Dict[str, object]) -> int:
-        candidates = (
-            info.get("filled_base_i"),
-            info.get("filled_size_i"),
-            info.get("filled"),
-            info.get("executedQuantity"),  # REST/WS common
-            info.get("Z"),  # Backpack WS executed quantity in quote may appear; try anyway
-        )
-        for candidate in candidates:
+    async def _abandon(order_service: "OrderService", symbol: str, order: Order) -> None:
+        if order.state in FINAL_STATES:
+            return
+        try:
+            # Shielded so the cancel still reaches the venue if we are cancelled again.
+            await asyncio.shield(order_service.cancel(symbol, order.client_order_index))
+        except Exception:
+            pass  # best effort; the original cancellation is what propagates
+
+    async def _cancel_and_settle(
+        self, order_service: "OrderService", symbol: str, order: Order
+    ) -> Tuple["OrderEvent", bool]:
+        """Cancel ``order`` and return its latest event and whether it settled in time."""
+        await order_service.cancel(symbol, order.client_order_index)
+        try:
+            # wait_final applies the timeout to its shielded future directly; wrapping the
+            # coroutine in another wait_for would spawn a Task per cancel.
+            return await order.wait_final(timeout=self._cancel_wait_secs), True
+        except asyncio.TimeoutError:
+            return order.snapshot(), False
+
+    async def _await_attempt(
+        self, order: Order, until: float, enough_filled: int, size_decimals: int
+    ) -> Optional["OrderEvent"]:
+        """Wait for ``order`` to finish or fill at least ``enough_filled``.
+
+        Wakes on every pushed update rather than sleeping through the window, so
+        fills are acted on as soon as they arrive. Returns ``None`` if neither
+        happens by ``until`` (loop time).
+        """
+        try:
+            # One absolute timer for the whole window, however many updates arrive.
+            async with asyncio.timeout_at(until):
+                while True:
+                    # Check the latest state before waiting: updates that landed
+                    # before this call do not resolve next_update().
+                    event = order.snapshot()
+                    if (
+                        event.state in FINAL_STATES
+                        or self._extract_filled(event.info, size_decimals) >= enough_filled
+                    ):
+                        return event
+                    await order.next_update()
+        except TimeoutError:
+            return None
+
+    @staticmethod
+    def _extract_filled(info: Dict[str, object], size_decimals: int) -> int:
+        """Return the cumulative fill reported in ``info`` in integer base units."""
+        for key in _FILLED_INT_KEYS:
+            candidate = info.get(key)
             if candidate is None:
                 continue
+            # Exact type check first: ints need no conversion at all.
+            if type(candidate) is int:
+                return candidate
             try:
                 return int(float(candidate))
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
+                continue
+        for key in _FILLED_BASE_KEYS:
+            candidate = info.get(key)
+            if candidate is None:
+                continue
+            try:
+                return int(Decimal(str(candidate)).scaleb(size_decimals))
+            except (InvalidOperation, ValueError, OverflowError):
                 continue
         return 0
 
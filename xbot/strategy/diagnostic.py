@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from decimal import Decimal
 from typing import Optional, Dict, Any
 
@@ -8,6 +10,8 @@ from xbot.execution.router import ExecutionRouter
 from .base import Strategy, StrategyConfig
 from ..utils.logging import get_logger
 
+_LOG = get_logger(__name__)
+
 
 class DiagnosticStrategy(Strategy):
     """Validates connector capabilities with minimal live interactions.
@@ -21,18 +25,26 @@ class DiagnosticStrategy(Strategy):
 
     def __init__(self, *, router: ExecutionRouter, clock: WallClock, config: StrategyConfig) -> None:
         super().__init__(router=router, clock=clock, config=config)
-        self._logger = get_logger(__name__)
+        self._logger = _LOG
+        # Resolved once in start(); every WS snapshot dump reads trades for it.
+        self._venue_symbol: Optional[str] = None
 
     async def start(self) -> None:
         await super().start()
         sym = self.config.symbol
+        # Both the probe limit order and the tracking run trade this side.
+        is_ask = self.config.side == "sell"
         self._logger.info("diagnostic_start", extra={"symbol": sym})
 
         # Public capabilities
-        venue_symbol = self.router.market_data.resolve_symbol(sym)
-        price_dec, size_dec = await self.router.market_data.get_price_size_decimals(sym)
-        min_size_i = await self.router.market_data.get_min_size_i(sym)
-        bid_i, ask_i, scale = await self.router.market_data.get_top_of_book(sym)
+        market_data = self.router.market_data
+        venue_symbol = self._venue_symbol = market_data.resolve_symbol(sym)
+        # Independent reads; issue them together rather than back to back.
+        (price_dec, size_dec), min_size_i, (bid_i, ask_i, scale) = await asyncio.gather(
+            market_data.get_price_size_decimals(sym),
+            market_data.get_min_size_i(sym),
+            market_data.get_top_of_book(sym),
+        )
         self._logger.info(
             "md_ok",
             extra={
@@ -47,91 +59,107 @@ class DiagnosticStrategy(Strategy):
             },
         )
 
-        # Private capabilities (best-effort)
-        placed_coi: Optional[int] = None
-        try:
-            if bid_i and ask_i:
-                # Place a post-only order away from market to avoid fills
-                offset_ticks = max(1, int(self.config.price_offset_ticks or 10))
-                is_ask = self.config.side == "sell"
-                # Use minimum size for safety
-                size_i = min_size_i
-                # Price selection: move outside spread in the intended direction
-                ref = ask_i if is_ask else bid_i
-                price_i = ref + (offset_ticks if is_ask else -offset_ticks)
-                await self._dump_ws("before_initial_limit")
-                self._logger.info(
-                    "private_plan",
-                    extra={
-                        "venue_symbol": venue_symbol,
-                        "is_ask": is_ask,
-                        "offset_ticks": offset_ticks,
-                        "size_i": size_i,
-                        "ref_price_i": ref,
-                        "submit_price_i": price_i,
-                        "post_only": True,
-                    },
-                )
-                order = await self.router.submit_limit(
-                    symbol=sym,
-                    is_ask=is_ask,
-                    size_i=size_i,
-                    price_i=price_i,
-                    post_only=True,
-                )
-                placed_coi = order.client_order_index
-                self._logger.info(
-                    "limit_order_open",
-                    extra={
-                        "coi": placed_coi,
-                        "exchange_order_id": order.exchange_order_id,
-                        "size_i": size_i,
-                        "price_i": price_i,
-                    },
-                )
-                await self._dump_ws("after_initial_limit")
-                # Try fetch and then cancel (also log raw order if available)
-                await self.router.fetch_order(sym, placed_coi)
-                try:
-                    raw = await self.router.orders._connector.get_order(venue_symbol, placed_coi)  # type: ignore[attr-defined]
-                    self._logger.info("order_raw", extra={"coi": placed_coi, "raw": raw})
-                except Exception:
-                    pass
-                await self.router.cancel(sym, placed_coi)
-                cancel_info = {}
-                try:
-                    cancel_info = order.history[-1].info if order.history else {}
-                except Exception:
-                    pass
-                self._logger.info(
-                    "limit_order_cancelled",
-                    extra={"coi": placed_coi, "cancel_response": cancel_info.get("cancel_response")},
-                )
-                await self._dump_ws("after_cancel_initial_limit")
-                # Print order state machine/history
-                hist = [e.to_dict() for e in order.history]
-                self._logger.info("order_history", extra={"coi": placed_coi, "history": hist})
-        except Exception:
-            # Include stacktrace for better diagnostics
-            self._logger.exception("private_ops_skipped")
-
-        # Account snapshots (if available)
-        try:
-            positions = await self.router.positions.all_positions()
-            self._logger.info("positions_ok", extra={"count": len(list(positions))})
-        except Exception as exc:
-            self._logger.info("positions_unavailable", extra={"error": str(exc)})
+        # Account snapshots do not depend on the probe order below; fetch them meanwhile.
+        account = asyncio.gather(
+            self.router.positions.all_positions(),
+            self.router.fetch_margin(),
+            return_exceptions=True,
+        )
 
         try:
-            margin = await self.router.fetch_margin()
+            # Private capabilities (best-effort)
+            placed_coi: Optional[int] = None
+            try:
+                if bid_i and ask_i:
+                    # Place a post-only order away from market to avoid fills
+                    offset_ticks = max(1, int(self.config.price_offset_ticks or 10))
+                    # Use minimum size for safety
+                    size_i = min_size_i
+                    # Price selection: move outside spread in the intended direction
+                    ref = ask_i if is_ask else bid_i
+                    price_i = ref + (offset_ticks if is_ask else -offset_ticks)
+                    await self._dump_ws("before_initial_limit")
+                    self._logger.info(
+                        "private_plan",
+                        extra={
+                            "venue_symbol": venue_symbol,
+                            "is_ask": is_ask,
+                            "offset_ticks": offset_ticks,
+                            "size_i": size_i,
+                            "ref_price_i": ref,
+                            "submit_price_i": price_i,
+                            "post_only": True,
+                        },
+                    )
+                    order = await self.router.submit_limit(
+                        symbol=sym,
+                        is_ask=is_ask,
+                        size_i=size_i,
+                        price_i=price_i,
+                        post_only=True,
+                    )
+                    placed_coi = order.client_order_index
+                    self._logger.info(
+                        "limit_order_open",
+                        extra={
+                            "coi": placed_coi,
+                            "exchange_order_id": order.exchange_order_id,
+                            "size_i": size_i,
+                            "price_i": price_i,
+                        },
+                    )
+                    await self._dump_ws("after_initial_limit")
+                    # Try fetch and then cancel (also log raw order if available)
+                    fetched, raw = await asyncio.gather(
+                        self.router.fetch_order(sym, placed_coi),
+                        self.router.orders.connector.get_order(venue_symbol, placed_coi),
+                        return_exceptions=True,
+                    )
+                    if isinstance(fetched, BaseException):
+                        # Still cancel below rather than leave the probe order resting.
+                        self._logger.info("order_fetch_failed", extra={"coi": placed_coi, "error": str(fetched)})
+                    if not isinstance(raw, BaseException):
+                        self._logger.info("order_raw", extra={"coi": placed_coi, "raw": raw})
+                    await self.router.cancel(sym, placed_coi)
+                    cancel_info = {}
+                    try:
+                        cancel_info = order.history[-1].info if order.history else {}
+                    except Exception:
+                        pass
+                    self._logger.info(
+                        "limit_order_cancelled",
+                        extra={"coi": placed_coi, "cancel_response": cancel_info.get("cancel_response")},
+                    )
+                    await self._dump_ws("after_cancel_initial_limit")
+                    # Print order state machine/history
+                    if self._logger.isEnabledFor(logging.INFO):
+                        hist = [e.to_dict() for e in order.history]
+                        self._logger.info("order_history", extra={"coi": placed_coi, "history": hist})
+            except Exception:
+                # Include stacktrace for better diagnostics
+                self._logger.exception("private_ops_skipped")
+
+            # Account snapshots (if available)
+            positions, margin = await account
+        finally:
+            # If the probe was cancelled or a BaseException escaped, do not leave the
+            # account reads running behind it.
+            if not account.done():
+                account.cancel()
+                await asyncio.gather(account, return_exceptions=True)
+
+        if isinstance(positions, BaseException):
+            self._logger.info("positions_unavailable", extra={"error": str(positions)})
+        else:
+            self._logger.info("positions_ok", extra={"count": len(positions)})
+        if isinstance(margin, BaseException):
+            self._logger.info("margin_unavailable", extra={"error": str(margin)})
+        else:
             self._logger.info("margin_ok", extra={"has_data": bool(margin)})
-        except Exception as exc:
-            self._logger.info("margin_unavailable", extra={"error": str(exc)})
 
         # Extended diagnostic: run tracking-limit until fill, then close with market
         try:
             if bid_i and ask_i:
-                is_ask_open = self.config.side == "sell"
                 size_i = await self.router.market_data.to_size_i(sym, Decimal(str(self.config.qty)))
                 await self._dump_ws("before_tracking_limit")
 
@@ -141,7 +169,7 @@ class DiagnosticStrategy(Strategy):
                 tracking = await self.router.tracking_limit(
                     symbol=sym,
                     base_amount_i=size_i,
-                    is_ask=is_ask_open,
+                    is_ask=is_ask,
                     price_offset_ticks=self.config.price_offset_ticks or 0,
                     interval_secs=self.config.interval_secs,
                     timeout_secs=self.config.timeout_secs,
@@ -150,27 +178,30 @@ class DiagnosticStrategy(Strategy):
                 )
                 await tracking.wait_final()
                 # Log attempts/state machine
-                attempts = [
-                    {
-                        "attempt": a.attempt,
-                        "coi": a.client_order_index,
-                        "price_i": a.price_i,
-                        "state": a.state.value,
-                        "info": a.info,
-                    }
-                    for a in tracking.attempts
-                ]
-                self._logger.info(
-                    "tracking_done",
-                    extra={"attempts": attempts, "filled_base_i": tracking.filled_base_i},
-                )
+                if self._logger.isEnabledFor(logging.INFO):
+                    attempts = [
+                        {
+                            "attempt": a.attempt,
+                            "coi": a.client_order_index,
+                            "price_i": a.price_i,
+                            "state": a.state.value,
+                            "info": a.info,
+                            "timed_out": a.timed_out,
+                            "cancel_wait_timeout": a.cancel_wait_timeout,
+                        }
+                        for a in tracking.attempts
+                    ]
+                    self._logger.info(
+                        "tracking_done",
+                        extra={"attempts": attempts, "filled_base_i": tracking.filled_base_i},
+                    )
                 await self._dump_ws("after_tracking_limit")
 
                 # Close with market order
                 await self._dump_ws("before_close_market")
                 close_order = await self.router.submit_market(
                     symbol=sym,
-                    is_ask=not is_ask_open,
+                    is_ask=not is_ask,
                     size_i=size_i,
                     reduce_only=1,
                 )
@@ -183,8 +214,11 @@ class DiagnosticStrategy(Strategy):
                 )
                 await self._dump_ws("after_close_market")
                 # Print close order history if any updates persisted
-                close_hist = [e.to_dict() for e in close_order.history]
-                self._logger.info("order_history", extra={"coi": close_order.client_order_index, "history": close_hist})
+                if self._logger.isEnabledFor(logging.INFO):
+                    close_hist = [e.to_dict() for e in close_order.history]
+                    self._logger.info(
+                        "order_history", extra={"coi": close_order.client_order_index, "history": close_hist}
+                    )
         except Exception:
             self._logger.exception("extended_diagnostic_failed")
 
@@ -192,11 +226,13 @@ class DiagnosticStrategy(Strategy):
 
     async def _dump_ws(self, phase: str, *, extra: Optional[Dict[str, Any]] = None) -> None:
         cache = self.router.cache
-        if cache is None:
+        # The snapshots only feed the log record; skip them when it would be dropped.
+        if cache is None or not self._logger.isEnabledFor(logging.INFO):
             return
         try:
+            venue_symbol = self._venue_symbol or self.router.market_data.resolve_symbol(self.config.symbol)
             positions = await cache.snapshot_positions()
-            trades = await cache.snapshot_trades(self.router.market_data.resolve_symbol(self.config.symbol))
+            trades = await cache.snapshot_trades(venue_symbol)
             balances = await cache.snapshot_balances()
             payload: Dict[str, Any] = {"phase": phase, "positions": positions, "trades": trades, "balances": balances}
             if extra:
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+from xbot.execution.market_data_service import MarketDataService
+from xbot.execution.order_service import OrderService
+from xbot.execution.position_service import PositionService
+from xbot.execution.risk_service import RiskLimits, RiskService
+from xbot.execution.router import ExecutionRouter
+from xbot.execution.tracking_limit import TrackingLimitEngine
+
+
+class FakeConnector:
+    """In-memory IConnector: fixed metadata, a settable book, and call counters."""
+
+    venue = "fake"
+
+    def __init__(
+        self,
+        *,
+        book: Tuple[Optional[int], Optional[int], int] = (10000, 10010, 100),
+        decimals: Tuple[int, int] = (2, 3),
+        min_size_i: int = 10,
+    ) -> None:
+        self.book = book
+        self.decimals = decimals
+        self.min_size_i = min_size_i
+        self.positions: List[Dict[str, Any]] = []
+        self.margin: Dict[str, Any] = {"available": 1}
+        self.calls: Counter[str] = Counter()
+        self.submitted: List[Dict[str, Any]] = []
+        # Awaited with the client order index before a submit is acked, to let a
+        # test push WS updates while the submit RPC is "in flight".
+        self.before_ack: Optional[Callable[[int], Awaitable[None]]] = None
+        self._next_id = 0
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def get_price_size_decimals(self, symbol: str) -> Tuple[int, int]:
+        self.calls["decimals"] += 1
+        return self.decimals
+
+    async def get_min_size_i(self, symbol: str) -> int:
+        self.calls["min_size"] += 1
+        return self.min_size_i
+
+    async def get_top_of_book(self, symbol: str) -> Tuple[Optional[int], Optional[int], int]:
+        self.calls["top_of_book"] += 1
+        return self.book
+
+    async def _ack(self, client_order_index: int, **order: Any) -> str:
+        self.submitted.append({"client_order_index": client_order_index, **order})
+        if self.before_ack is not None:
+            await self.before_ack(client_order_index)
+        self._next_id += 1
+        return f"x{self._next_id}"
+
+    async def submit_limit_order(self, *, symbol: str, client_order_index: int, **order: Any) -> str:
+        self.calls["submit_limit"] += 1
+        return await self._ack(client_order_index, symbol=symbol, **order)
+
+    async def submit_market_order(self, *, symbol: str, client_order_index: int, **order: Any) -> str:
+        self.calls["submit_market"] += 1
+        return await self._ack(client_order_index, symbol=symbol, **order)
+
+    async def cancel_by_client_id(self, symbol: str, client_order_index: int) -> Dict[str, Any]:
+        self.calls["cancel"] += 1
+        return {"ok": True}
+
+    async def cancel_by_order_id(self, symbol: str, order_id: str) -> Dict[str, Any]:
+        self.calls["cancel"] += 1
+        return {"ok": True}
+
+    async def get_order(self, symbol: str, client_order_index: int) -> Dict[str, Any]:
+        self.calls["get_order"] += 1
+        return {"status": "new"}
+
+    async def get_positions(self) -> List[Dict[str, Any]]:
+        self.calls["positions"] += 1
+        return list(self.positions)
+
+    async def get_margin(self) -> Dict[str, Any]:
+        self.calls["margin"] += 1
+        return dict(self.margin)
+
+
+@dataclass
+class Services:
+    connector: FakeConnector
+    market_data: MarketDataService
+    positions: PositionService
+    risk: RiskService
+    engine: TrackingLimitEngine
+    orders: OrderService
+    router: ExecutionRouter
+
+
+@pytest.fixture
+def connector() -> FakeConnector:
+    return FakeConnector()
+
+
+@pytest.fixture
+def make_services(connector: FakeConnector, tmp_path: Path) -> Callable[..., Services]:
+    def build(
+        *,
+        limits: Optional[RiskLimits] = None,
+        interval_secs: float = 0.05,
+        timeout_secs: float = 2.0,
+        cancel_wait_secs: float = 0.05,
+        finished_ttl: float = 300.0,
+        **router_kwargs: Any,
+    ) -> Services:
+        market_data = MarketDataService(connector=connector, symbol_map={"SOL": "SOL_USDC"})
+        positions = PositionService()
+        risk = RiskService(market_data=market_data, position_service=positions, limits=limits)
+        engine = TrackingLimitEngine(
+            market_data=market_data,
+            default_interval_secs=interval_secs,
+            default_timeout_secs=timeout_secs,
+            cancel_wait_secs=cancel_wait_secs,
+        )
+        orders = OrderService(
+            connector=connector,
+            market_data=market_data,
+            risk_service=risk,
+            tracking_engine=engine,
+            log_root=tmp_path / "orders",
+            finished_ttl=finished_ttl,
+        )
+        router = ExecutionRouter(
+            order_service=orders,
+            position_service=positions,
+            risk_service=risk,
+            market_data=market_data,
+            **router_kwargs,
+        )
+        return Services(connector, market_data, positions, risk, engine, orders, router)
+
+    return build
+
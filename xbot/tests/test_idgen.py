@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from xbot.utils.idgen import DEFAULT_COI_MODULO, ClientOrderIdGenerator
+
+
+def test_indices_wrap_past_the_modulo_and_skip_zero():
+    generator = ClientOrderIdGenerator(start=3, modulo=5)
+
+    assert [generator.next() for _ in range(7)] == [3, 4, 1, 2, 3, 4, 1]
+
+
+@pytest.mark.parametrize("start", [0, 5, 10])
+def test_seed_on_a_multiple_of_the_modulo_starts_at_one(start):
+    assert ClientOrderIdGenerator(start=start, modulo=5).next() == 1
+
+
+def test_batch_continues_the_sequence():
+    generator = ClientOrderIdGenerator(start=4, modulo=5)
+
+    assert list(generator.batch(3)) == [4, 1, 2]
+    assert generator.next() == 3
+
+
+def test_invalid_modulo_is_rejected():
+    with pytest.raises(ValueError):
+        ClientOrderIdGenerator(modulo=0)
+
+
+def test_memory_stays_flat_after_the_wrap():
+    generator = ClientOrderIdGenerator(start=DEFAULT_COI_MODULO - 2)
+    assert [generator.next() for _ in range(3)] == [DEFAULT_COI_MODULO - 2, DEFAULT_COI_MODULO - 1, 1]
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(100_000):
+            generator.next()
+        grown = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert grown < 64 * 1024
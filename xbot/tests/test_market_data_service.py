@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from xbot.core.cache import MarketCache
+
+
+async def test_fresh_cached_book_skips_the_venue(make_services, connector):
+    services = make_services()
+    cache = MarketCache()
+    services.market_data.use_book_cache(cache)
+    await services.market_data.get_price_size_decimals("SOL")
+    await cache.set_top("SOL_USDC", 100.5, 100.7)
+
+    assert await services.market_data.get_top_of_book("SOL") == (10050, 10070, 100)
+    assert connector.calls["top_of_book"] == 0
+
+
+async def test_stale_or_one_sided_cached_book_falls_back_to_rest(make_services, connector):
+    services = make_services()
+    cache = MarketCache()
+    services.market_data.use_book_cache(cache, max_age=0.5)
+    await services.market_data.get_price_size_decimals("SOL")
+
+    cache.orderbooks["SOL_USDC"] = (100.5, 100.7, 0.0)
+    assert await services.market_data.get_top_of_book("SOL") == connector.book
+    await cache.set_top("SOL_USDC", 100.5, None)
+    assert await services.market_data.get_top_of_book("SOL") == connector.book
+    assert connector.calls["top_of_book"] == 2
+
+
+def _slow_decimals(connector):
+    release = asyncio.Event()
+    get_price_size_decimals = connector.get_price_size_decimals
+
+    async def slow(symbol):
+        await release.wait()
+        return await get_price_size_decimals(symbol)
+
+    # Patched before the service is built: it binds the connector methods once.
+    connector.get_price_size_decimals = slow
+    return release
+
+
+async def test_concurrent_callers_share_one_venue_call(make_services, connector):
+    release = _slow_decimals(connector)
+    market_data = make_services().market_data
+
+    callers = [asyncio.ensure_future(market_data.get_price_size_decimals("SOL")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(*callers) == [connector.decimals] * 3
+    assert connector.calls["decimals"] == 1
+
+
+async def test_cancelled_caller_does_not_abort_the_shared_load(make_services, connector):
+    release = _slow_decimals(connector)
+    market_data = make_services().market_data
+
+    cancelled = asyncio.ensure_future(market_data.get_price_size_decimals("SOL"))
+    waiting = asyncio.ensure_future(market_data.get_price_size_decimals("SOL"))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == connector.decimals
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert connector.calls["decimals"] == 1
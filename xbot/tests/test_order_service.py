@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import pytest
+
+from xbot.execution.models import OrderState
+from xbot.execution.order_service import OrderUpdatePayload, UnknownOrderError
+
+
+async def _submit(services, **kwargs):
+    return await services.router.submit_limit(symbol="SOL", is_ask=False, size_i=100, price_i=10000, **kwargs)
+
+
+async def test_finished_orders_are_pruned_after_ttl(make_services):
+    services = make_services(finished_ttl=0.0)
+    first = await _submit(services)
+    await services.router.cancel("SOL", first.client_order_index)
+
+    second = await _submit(services)
+
+    with pytest.raises(UnknownOrderError):
+        await services.router.cancel("SOL", first.client_order_index)
+    assert first.exchange_order_id not in services.orders._by_exchange_id
+    assert services.orders._get(second.client_order_index) is second
+
+
+async def test_live_orders_survive_pruning(make_services):
+    services = make_services(finished_ttl=0.0)
+    resting = await _submit(services)
+    done = await _submit(services)
+    await services.router.cancel("SOL", done.client_order_index)
+
+    await _submit(services)
+
+    assert services.orders._get(resting.client_order_index) is resting
+
+
+async def test_late_update_for_pruned_order_is_not_misrouted(make_services):
+    services = make_services(finished_ttl=0.0)
+    pruned = await _submit(services)
+    await services.router.cancel("SOL", pruned.client_order_index)
+    live = await _submit(services)
+
+    for payload in (
+        OrderUpdatePayload(
+            client_order_index=pruned.client_order_index,
+            state=OrderState.FILLED,
+            exchange_order_id=pruned.exchange_order_id,
+        ),
+        OrderUpdatePayload(client_order_index=0, state=OrderState.FILLED, exchange_order_id=pruned.exchange_order_id),
+        OrderUpdatePayload(client_order_index=123456, state=OrderState.FILLED, exchange_order_id="foreign"),
+    ):
+        with pytest.raises(UnknownOrderError):
+            await services.orders.ingest_update(payload)
+
+    assert live.state is OrderState.OPEN
+
+
+async def test_update_without_client_id_reaches_unacked_order(make_services, connector):
+    services = make_services()
+    pushed = []
+
+    async def push_fill(coi: int) -> None:
+        # The venue reports the fill with only its own order id, before the submit ack.
+        pushed.append(
+            await services.orders.ingest_update(
+                OrderUpdatePayload(client_order_index=0, state=OrderState.FILLED, exchange_order_id="x1")
+            )
+        )
+
+    connector.before_ack = push_fill
+    order = await _submit(services)
+
+    assert pushed == [order]
+    assert order.state is OrderState.FILLED
+
+
+async def test_fill_before_submit_ack_is_not_reopened(make_services, connector):
+    services = make_services()
+
+    async def fill_in_flight(coi: int) -> None:
+        await services.orders.ingest_update(
+            OrderUpdatePayload(client_order_index=coi, state=OrderState.FILLED, info={"filled_base_i": 100})
+        )
+
+    connector.before_ack = fill_in_flight
+    order = await _submit(services)
+
+    assert order.state is OrderState.FILLED
+    assert [event.state for event in order.history] == [OrderState.SUBMITTING, OrderState.FILLED]
+    assert order.exchange_order_id == "x1"
+    assert services.orders._by_exchange_id["x1"] is order
+
+
+async def test_cached_shape_is_revalidated_after_metadata_changes(make_services, connector):
+    services = make_services()
+    await _submit(services)
+
+    connector.min_size_i = 1000
+    services.market_data.invalidate("SOL")
+
+    with pytest.raises(ValueError, match="below minimum"):
+        await _submit(services)
+
+
+async def test_cancel_many_reports_a_failed_cancel_in_place(make_services, connector):
+    services = make_services()
+    orders = [await _submit(services) for _ in range(3)]
+    cancel_by_order_id = connector.cancel_by_order_id
+
+    async def flaky_cancel(symbol, order_id):
+        if order_id == orders[1].exchange_order_id:
+            raise ConnectionError("cancel rejected")
+        return await cancel_by_order_id(symbol, order_id)
+
+    connector.cancel_by_order_id = flaky_cancel
+    results = await services.router.cancel_many("SOL", [order.client_order_index for order in orders])
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], ConnectionError)
+    assert orders[0].state is OrderState.CANCELLED and orders[2].state is OrderState.CANCELLED
+    assert orders[1].state is not OrderState.CANCELLED
+    assert connector.calls["cancel"] == 2
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+from xbot.execution.position_service import PositionService, PositionSnapshot
+
+
+def _snapshot(symbol: str, base_qty: int) -> PositionSnapshot:
+    qty = Decimal(base_qty)
+    return PositionSnapshot(symbol=symbol, base_qty=qty, quote_value=qty, notional=qty)
+
+
+async def _subscribe(service: PositionService, symbol: str | None = None):
+    stream = service.stream(symbol)
+    # The generator subscribes on its first step; prime it with a first snapshot.
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+    await service.ingest(_snapshot(symbol or "SOL", 0))
+    assert (await first).base_qty == 0
+    return stream
+
+
+async def test_stream_yields_snapshots_in_ingest_order():
+    service = PositionService()
+    stream = await _subscribe(service, "SOL")
+
+    for qty in (1, 2, 3):
+        await service.ingest(_snapshot("SOL", qty))
+    await service.ingest(_snapshot("ETH", 9))
+
+    assert [(await anext(stream)).base_qty for _ in range(3)] == [1, 2, 3]
+    await stream.aclose()
+
+
+async def test_stream_drops_the_oldest_snapshot_when_full():
+    service = PositionService(stream_queue_size=2)
+    stream = await _subscribe(service)
+
+    for qty in (1, 2, 3):
+        await service.ingest(_snapshot("SOL", qty))
+
+    assert [(await anext(stream)).base_qty for _ in range(2)] == [2, 3]
+    await stream.aclose()
+
+
+async def test_closing_the_stream_removes_the_subscriber():
+    service = PositionService()
+    stream = await _subscribe(service)
+    assert len(service._subscribers) == 1
+
+    await stream.aclose()
+    await service.ingest(_snapshot("SOL", 1))
+
+    assert service._subscribers == []
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+
+from xbot.execution.position_service import PositionSnapshot
+from xbot.execution.risk_service import RiskLimits, RiskViolationError
+
+
+def _reference_violation(
+    net_base: Decimal,
+    size_i: int,
+    is_ask: bool,
+    price_i: int,
+    decimals: tuple[int, int],
+    limits: RiskLimits,
+) -> bool:
+    """The checks in plain Decimal arithmetic, as the service computed them before integer limits."""
+    price_decimals, size_decimals = decimals
+    size = Decimal(size_i) / (Decimal(10) ** size_decimals)
+    future_base = net_base - size if is_ask else net_base + size
+    if limits.max_position is not None and abs(future_base) > limits.max_position:
+        return True
+    notional = Decimal(price_i) / (Decimal(10) ** price_decimals) * size
+    return limits.max_notional is not None and notional > limits.max_notional
+
+
+async def _violation(services, *, net_base: Optional[Decimal], size_i: int, is_ask: bool, price_i: int) -> bool:
+    if net_base is not None:
+        await services.positions.ingest(
+            PositionSnapshot(symbol="SOL", base_qty=net_base, quote_value=Decimal(0), notional=Decimal(0))
+        )
+    try:
+        await services.risk.validate_order(symbol="SOL", size_i=size_i, is_ask=is_ask, price_i=price_i)
+    except RiskViolationError:
+        return True
+    return False
+
+
+@pytest.mark.parametrize(
+    "decimals, limits, net_base, size_i, is_ask, price_i",
+    [
+        # Position finer than the size step: 472.002485 is within 472.8.
+        ((2, 0), RiskLimits(max_position=Decimal("472.8")), Decimal("-0.002485"), 472, True, 100),
+        ((2, 0), RiskLimits(max_position=Decimal("472.8")), Decimal("-0.9"), 472, True, 100),
+        ((2, 0), RiskLimits(max_position=Decimal("472.8")), Decimal("0.5"), 472, False, 100),
+        ((2, 3), RiskLimits(max_position=Decimal("5")), Decimal("4.9995"), 500, False, 100),
+        ((2, 3), RiskLimits(max_position=Decimal("5")), Decimal("4.5"), 500, False, 100),
+        ((2, 3), RiskLimits(max_position=Decimal("5")), None, 5001, True, 100),
+        ((2, 3), RiskLimits(max_position=Decimal("5")), None, 5000, True, 100),
+        ((2, 3), RiskLimits(max_notional=Decimal("100.005")), None, 10000, False, 1000),
+        ((2, 3), RiskLimits(max_notional=Decimal("100.005")), None, 10001, False, 1000),
+        ((2, 3), RiskLimits(max_notional=Decimal("99.99")), None, 10000, False, 999),
+    ],
+)
+async def test_integer_limits_match_decimal_checks(
+    connector, make_services, decimals, limits, net_base, size_i, is_ask, price_i
+):
+    connector.decimals = decimals
+    connector.min_size_i = 1
+    services = make_services(limits=limits)
+
+    violated = await _violation(services, net_base=net_base, size_i=size_i, is_ask=is_ask, price_i=price_i)
+
+    expected = _reference_violation(net_base or Decimal(0), size_i, is_ask, price_i, decimals, limits)
+    assert violated is expected
+
+
+async def test_batch_validation_matches_single_orders(connector, make_services):
+    connector.min_size_i = 1
+    services = make_services(limits=RiskLimits(max_position=Decimal("1"), max_notional=Decimal("70")))
+    await services.positions.ingest(
+        PositionSnapshot(symbol="SOL", base_qty=Decimal("0.4005"), quote_value=Decimal(0), notional=Decimal(0))
+    )
+    orders = [(599, False, 10000), (600, False, 10000), (500, True, 10000), (499, False, 15000), (0, False, 1)]
+
+    results = await services.risk.validate_orders(symbol="SOL", orders=orders)
+
+    assert results[0] is None
+    assert isinstance(results[1], RiskViolationError)
+    assert results[2] is None
+    assert isinstance(results[3], RiskViolationError)
+    assert isinstance(results[4], ValueError)
+
+
+async def test_validate_position_works_before_any_full_validation(make_services):
+    services = make_services(limits=RiskLimits(max_position=Decimal("1")))
+
+    await services.risk.validate_position(symbol="SOL", size_i=1000, is_ask=False)
+    with pytest.raises(RiskViolationError):
+        await services.risk.validate_position(symbol="SOL", size_i=1001, is_ask=False)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+async def test_fresh_account_snapshot_is_reused(make_services, connector):
+    router = make_services(account_max_age=60.0).router
+
+    first = await router.fetch_account()
+    second = await router.fetch_account()
+
+    assert second is first
+    assert connector.calls["positions"] == 1 and connector.calls["margin"] == 1
+
+
+async def test_stale_account_snapshot_is_served_while_refreshing(make_services, connector):
+    router = make_services(account_max_age=0.0, account_stale_age=60.0).router
+    first = await router.fetch_account()
+    connector.margin = {"available": 2}
+
+    served = await router.fetch_account()
+    await asyncio.sleep(0.01)
+    refreshed = await router.fetch_account()
+
+    assert served is first
+    assert connector.calls["margin"] == 2
+    assert refreshed.margin == {"available": 2}
+
+
+async def test_expired_account_snapshot_waits_for_a_live_fetch(make_services, connector):
+    router = make_services(account_max_age=0.0, account_stale_age=0.0).router
+    await router.fetch_account()
+    connector.margin = {"available": 2}
+
+    assert await router.fetch_margin() == {"available": 2}
+    assert connector.calls["margin"] == 2
+
+
+async def test_invalidate_drops_the_account_snapshot(make_services, connector):
+    router = make_services(account_max_age=60.0).router
+    await router.fetch_account()
+    connector.positions = [{"symbol": "SOL_USDC", "size": "1"}]
+
+    router.invalidate_account()
+    snapshot = await router.fetch_account()
+
+    assert snapshot.positions == [{"symbol": "SOL_USDC", "size": "1"}]
+    assert connector.calls["positions"] == 2
+
+
+async def test_failed_account_leg_is_not_cached(make_services, connector):
+    calls = 0
+
+    async def flaky_margin():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ConnectionError("margin down")
+        return {"available": 1}
+
+    # Patched before the router is built: it binds the connector methods once.
+    connector.get_margin = flaky_margin
+    router = make_services(account_max_age=60.0).router
+    failed = await router.fetch_account()
+    recovered = await router.fetch_account()
+
+    assert isinstance(failed.errors["margin"], ConnectionError)
+    assert recovered.margin == {"available": 1} and not recovered.errors
+
+
+async def test_stop_cancels_refreshes_detached_by_invalidate(make_services, connector):
+    release = asyncio.Event()
+    cancelled = 0
+
+    async def slow_margin():
+        nonlocal cancelled
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return {"available": 1}
+
+    connector.get_margin = slow_margin
+    router = make_services().router
+    first = asyncio.ensure_future(router.fetch_account())
+    await asyncio.sleep(0.01)
+    router.invalidate_account()
+    second = asyncio.ensure_future(router.fetch_account())
+    await asyncio.sleep(0.01)
+
+    await router.stop()
+
+    assert cancelled == 2
+    for caller in (first, second):
+        with pytest.raises(asyncio.CancelledError):
+            await caller
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from xbot.execution.models import OrderState
+from xbot.execution.order_service import OrderUpdatePayload
+
+
+async def _next_submit(connector, count: int) -> int:
+    """Wait until ``count`` orders were submitted and return the last client index."""
+    while len(connector.submitted) < count:
+        await asyncio.sleep(0.005)
+    return connector.submitted[count - 1]["client_order_index"]
+
+
+async def _push(services, coi: int, state: OrderState, info: Dict[str, Any]) -> None:
+    await services.orders.ingest_update(OrderUpdatePayload(client_order_index=coi, state=state, info=info))
+
+
+def _place(services, base_amount_i: int, **kwargs: Any) -> "asyncio.Task":
+    return asyncio.ensure_future(
+        services.router.tracking_limit(symbol="SOL", base_amount_i=base_amount_i, is_ask=False, **kwargs)
+    )
+
+
+async def test_partial_fill_covering_the_order_cancels_early(make_services, connector):
+    services = make_services()
+    task = _place(services, 100, interval_secs=5.0)
+    coi = await _next_submit(connector, 1)
+
+    await _push(services, coi, OrderState.PARTIALLY_FILLED, {"filled_base_i": 99})
+    result = await asyncio.wait_for(task, timeout=1.0)
+
+    assert result.filled_base_i == 99
+    assert connector.calls["cancel"] == 1
+    assert result.attempts[0].state is OrderState.CANCELLED
+
+
+async def test_venue_fill_amounts_are_scaled_base_quantities(make_services, connector):
+    # Size step 0.001: 1000 units is 1.000 base. Backpack "Z" is the quote amount.
+    services = make_services()
+    task = _place(services, 1000, interval_secs=5.0)
+    coi = await _next_submit(connector, 1)
+
+    await _push(services, coi, OrderState.PARTIALLY_FILLED, {"z": "0.700", "Z": "105.00"})
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    assert connector.calls["cancel"] == 0
+
+    await _push(services, coi, OrderState.PARTIALLY_FILLED, {"z": "0.999", "Z": "149.85"})
+    result = await asyncio.wait_for(task, timeout=1.0)
+
+    assert result.filled_base_i == 999
+
+
+async def test_unchanged_quote_keeps_the_order_resting(make_services, connector):
+    services = make_services()
+    task = _place(services, 100, interval_secs=0.03)
+    coi = await _next_submit(connector, 1)
+
+    # Several windows elapse while the book stays put.
+    await asyncio.sleep(0.15)
+    assert connector.calls["submit_limit"] == 1
+    assert connector.calls["cancel"] == 0
+
+    await _push(services, coi, OrderState.FILLED, {})
+    result = await asyncio.wait_for(task, timeout=1.0)
+
+    assert result.filled_base_i == 100
+    assert result.attempts_count == 1
+
+
+async def test_moved_quote_replaces_the_order(make_services, connector):
+    services = make_services()
+    task = _place(services, 100, interval_secs=0.03)
+    await _next_submit(connector, 1)
+
+    connector.book = (10005, 10015, 100)
+    coi = await _next_submit(connector, 2)
+    await _push(services, coi, OrderState.FILLED, {})
+    result = await asyncio.wait_for(task, timeout=1.0)
+
+    assert [order["price"] for order in connector.submitted] == [10000, 10005]
+    assert result.attempts[0].state is OrderState.CANCELLED
+    assert result.filled_base_i == 100
+
+
+async def test_cancelling_place_cancels_the_resting_order(make_services, connector):
+    services = make_services()
+    task = _place(services, 100, interval_secs=5.0)
+    coi = await _next_submit(connector, 1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert connector.calls["cancel"] == 1
+    assert services.orders._get(coi).state is OrderState.CANCELLED
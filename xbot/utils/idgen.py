@@ -1,27 +1,41 @@
 from __future__ import annotations
 
 import itertools
-import secrets
-from typing import Iterable
+import time
+from functools import partial
+from typing import Callable, Iterable
+
+# Default index space: 1 .. 2**31 - 1 fits the 32-bit client id fields of both
+# supported venues, so the sequence only wraps after ~2.1 billion orders.
+DEFAULT_COI_MODULO = 2**31
 
 
 class ClientOrderIdGenerator:
-    """Simple circular generator for connector-scoped client order indices."""
+    """Simple circular generator for connector-scoped client order indices.
+
+    Indices cycle through ``1 .. modulo - 1``; zero is never produced. Without an
+    explicit ``start`` the sequence is seeded from the millisecond clock, so a
+    restarted process continues past the indices its predecessor used instead of
+    landing on a random, possibly recent, one.
+    """
 
-    def __init__(self, *, start: int | None = None, modulo: int = 1_000_000) -> None:
+    next: Callable[[], int]
+
+    def __init__(self, *, start: int | None = None, modulo: int = DEFAULT_COI_MODULO) -> None:
         if modulo <= 0:
             raise ValueError("modulo must be positive")
-        seed = start if start is not None else secrets.randbelow(modulo)
-        self._counter = itertools.count(seed)
-        self._modulo = modulo
-
-    def next(self) -> int:
-        value = next(self._counter) % self._modulo
-        return value if value > 0 else 1
+        seed = start if start is not None else time.time_ns() // 1_000_000
+        ids = range(1, max(modulo, 2))
+        first = seed % modulo or 1
+        # The whole sequence is built from C iterators and ``next`` is bound to it
+        # directly, so drawing an index runs no Python-level frame. The range is
+        # re-iterated on each lap; itertools.cycle would keep a copy of every index.
+        laps = itertools.chain.from_iterable(itertools.repeat(ids))
+        self.next = partial(next, itertools.chain(range(first, ids.stop), laps))
 
     def batch(self, count: int) -> Iterable[int]:
         for _ in range(count):
             yield self.next()
 
 
-__all__ = ["ClientOrderIdGenerator"]
+__all__ = ["ClientOrderIdGenerator", "DEFAULT_COI_MODULO"]
@@ -8,6 +8,10 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
 
 DEFAULT_EXCLUDE = {
     "name",
@@ -60,6 +64,11 @@ class JsonFormatter(logging.Formatter):
             payload["extra"] = extras
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass  # e.g. ints beyond 64 bits; the stdlib encoder handles those
         return json.dumps(payload, ensure_ascii=True)
 
 